@@ -1,13 +1,29 @@
 import re
 import html
 import argparse
+import asyncio
+import codecs
+import hashlib
 import json
+import mmap
+import multiprocessing
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
 from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+from xml.etree import ElementTree
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError, ProtocolError
 from urllib3.util.retry import Retry
 
 try:
@@ -15,6 +31,18 @@ try:
 except Exception:  # pragma: no cover - optional dependency fallback
     PdfReader = None
 
+try:
+    import httpx
+except Exception:  # pragma: no cover - optional dependency fallback
+    httpx = None
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except Exception:  # pragma: no cover - optional dependency fallback
+    HTTP2_AVAILABLE = False
+
 
 ROOT = Path(__file__).resolve().parent
 
@@ -31,6 +59,21 @@ SOURCE_PRIORITY_RULES: List[Tuple[str, int]] = [
     ("raw.githubusercontent.com/", 88),
 ]
 _WEB_RENDER_READY: Optional[bool] = None
+_BROWSER_POOL: Optional["BrowserPool"] = None
+_BROWSER_POOL_LOCK = threading.Lock()
+DEFAULT_RENDER_CONCURRENCY = 2
+_RENDER_CONCURRENCY = DEFAULT_RENDER_CONCURRENCY
+DEFAULT_PER_HOST_LIMIT = 2
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+ARXIV_BATCH_SIZE = 50
+ATOM_NS = "http://www.w3.org/2005/Atom"
+DEFAULT_SOURCE_CACHE = ROOT / "scripts" / "source_cache.jsonl"
+DEFAULT_PROBE_TTL_HOURS = 24.0
+# Release months from these sources never change once resolved.
+PERMANENT_RELEASE_SOURCES = {"arxiv_published", "url_pattern"}
+DEFAULT_DOWNLOAD_MANIFEST = ROOT / "scripts" / "download_manifest.json"
+DEFAULT_PDF_STORE = ROOT / ".pdf_store"
+DEFAULT_TEXT_CACHE = ROOT / ".text_cache"
 
 MODELS: List[Dict[str, Any]] = [
     # 2026-02
@@ -420,22 +463,352 @@ MODELS: List[Dict[str, Any]] = [
 ]
 
 
-def build_session() -> requests.Session:
-    session = requests.Session()
-    retry = Retry(
-        total=1,
-        connect=1,
-        read=1,
-        backoff_factor=0.5,
+class HostLimiter:
+    """Caps in-flight requests per host so parallel runs stay polite."""
+
+    def __init__(self, per_host: int = DEFAULT_PER_HOST_LIMIT) -> None:
+        self.per_host = max(1, per_host)
+        self._lock = threading.Lock()
+        self._slots: Dict[str, threading.BoundedSemaphore] = {}
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            sem = self._slots.get(host)
+            if sem is None:
+                sem = threading.BoundedSemaphore(self.per_host)
+                self._slots[host] = sem
+        with sem:
+            yield
+
+
+_HOST_LIMITER = HostLimiter()
+
+
+def configure_host_limit(per_host: int) -> None:
+    global _HOST_LIMITER
+    _HOST_LIMITER = HostLimiter(per_host)
+
+
+def host_slot(url: str):
+    return _HOST_LIMITER.slot(url)
+
+
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_READ_TIMEOUT = 20.0
+
+
+class CappedRetry(Retry):
+    """Retry that honors Retry-After on 429/503 but never sleeps longer than a cap."""
+
+    DEFAULT_MAX_RETRY_AFTER = 60.0
+
+    def __init__(
+        self, *args: Any, max_retry_after: float = DEFAULT_MAX_RETRY_AFTER, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.max_retry_after = max_retry_after
+
+    def new(self, **kw: Any) -> "CappedRetry":
+        retry = super().new(**kw)
+        retry.max_retry_after = self.max_retry_after
+        return retry
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.max_retry_after)
+
+
+def _count_retries(
+    session: requests.Session, resp: requests.Response, *args: Any, **kwargs: Any
+) -> None:
+    retries = getattr(getattr(resp, "raw", None), "retries", None)
+    history = getattr(retries, "history", None) or ()
+    if not history:
+        return
+    with session.retry_lock:
+        session.retry_counts[resp.request.url] += len(history)
+
+
+def _build_retry(
+    retries: int = 1,
+    backoff_factor: float = 0.5,
+    max_retry_after: float = CappedRetry.DEFAULT_MAX_RETRY_AFTER,
+) -> CappedRetry:
+    return CappedRetry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff_factor,
         status_forcelist=[429, 500, 502, 503, 504],
         allowed_methods=["GET", "HEAD"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+        max_retry_after=max_retry_after,
+    )
+
+
+def build_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+    read_timeout: float = DEFAULT_READ_TIMEOUT,
+    retries: int = 1,
+    backoff_factor: float = 0.5,
+    max_retry_after: float = CappedRetry.DEFAULT_MAX_RETRY_AFTER,
+) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=_build_retry(retries, backoff_factor, max_retry_after),
     )
-    adapter = HTTPAdapter(max_retries=retry)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
+    session.request_timeout = (connect_timeout, read_timeout)
+    session.retry_counts = Counter()
+    session.retry_lock = threading.Lock()
+    session.hooks["response"].append(
+        lambda resp, *args, **kwargs: _count_retries(session, resp, *args, **kwargs)
+    )
     return session
 
 
+def build_async_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+    read_timeout: float = DEFAULT_READ_TIMEOUT,
+    retries: int = 1,
+    backoff_factor: float = 0.5,
+    max_retry_after: float = CappedRetry.DEFAULT_MAX_RETRY_AFTER,
+) -> "AsyncSession":
+    """Same options as ``build_session``; ``pool_connections`` has no httpx equivalent."""
+    if httpx is None:
+        raise RuntimeError("the async backend needs httpx (pip install 'httpx[http2]')")
+    return AsyncSession(
+        _build_retry(retries, backoff_factor, max_retry_after),
+        pool_maxsize=pool_maxsize,
+        connect_timeout=connect_timeout,
+        read_timeout=read_timeout,
+    )
+
+
+def request_timeout(session: requests.Session) -> Any:
+    return getattr(session, "request_timeout", DEFAULT_READ_TIMEOUT)
+
+
+def retry_count(session: requests.Session, url: str) -> int:
+    counts = getattr(session, "retry_counts", None)
+    if not counts:
+        return 0
+    with session.retry_lock:
+        return sum(n for u, n in counts.items() if u == url or u.startswith(url + "?"))
+
+
+BACKENDS = ("threads", "async")
+
+
+class _RetryResponse:
+    """The slice of a urllib3 response that ``Retry`` reads when deciding a retry."""
+
+    def __init__(self, status: int, headers: Any) -> None:
+        self.status = status
+        self.headers = headers
+
+    def get_redirect_location(self) -> bool:
+        return False
+
+
+def _requests_error(exc: Exception) -> requests.RequestException:
+    # Keep the requests exception names: probe reasons embed them and get cached.
+    if isinstance(exc, httpx.ConnectTimeout):
+        return requests.ConnectTimeout(str(exc))
+    if isinstance(exc, httpx.TimeoutException):
+        return requests.ReadTimeout(str(exc))
+    return requests.ConnectionError(str(exc))
+
+
+class _AsyncRaw:
+    """File-like view of a streamed body for parsers such as ``iterparse``."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._buffer = b""
+        self.decode_content = True
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+class AsyncSessionResponse:
+    """A streamed ``httpx`` response behind the ``requests.Response`` calls this module makes."""
+
+    def __init__(self, session: "AsyncSession", resp: Any) -> None:
+        self._session = session
+        self._resp = resp
+        self.status_code = resp.status_code
+        self.headers = resp.headers
+        self.url = str(resp.url)
+        self.request = requests.Request(resp.request.method, self.url)
+        self.encoding = requests.utils.get_encoding_from_headers(resp.headers)
+        self._raw: Optional[_AsyncRaw] = None
+
+    def iter_content(self, chunk_size: int = 1) -> Iterator[bytes]:
+        chunks = self._resp.aiter_bytes(chunk_size)
+        while True:
+            try:
+                yield self._session._submit(chunks.__anext__())
+            except StopAsyncIteration:
+                return
+            except httpx.HTTPError as e:
+                raise _requests_error(e) from e
+
+    @property
+    def raw(self) -> _AsyncRaw:
+        if self._raw is None:
+            self._raw = _AsyncRaw(self.iter_content(16384))
+        return self._raw
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+    def close(self) -> None:
+        self._session._submit(self._resp.aclose())
+
+    def __enter__(self) -> "AsyncSessionResponse":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class AsyncSession:
+    """Drop-in for the ``requests.Session`` from ``build_session`` backed by ``httpx``.
+
+    One ``httpx.AsyncClient`` runs on a dedicated asyncio thread, so every
+    stage worker's requests share one event loop and, with ``h2`` installed,
+    multiplex over one HTTP/2 connection per host. Retries follow the same
+    ``CappedRetry`` policy and are counted in ``retry_counts`` like the
+    threads backend.
+    """
+
+    def __init__(
+        self,
+        retry: Retry,
+        pool_maxsize: int = 10,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+    ) -> None:
+        self.retry = retry
+        self.request_timeout = (connect_timeout, read_timeout)
+        self.retry_counts: Counter = Counter()
+        self.retry_lock = threading.Lock()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="httpx", daemon=True
+        )
+        self._thread.start()
+        # urllib3 opens extra connections past pool_maxsize instead of blocking.
+        limits = httpx.Limits(max_connections=None, max_keepalive_connections=pool_maxsize)
+        self._client = self._submit(self._open(limits))
+
+    async def _open(self, limits: Any) -> Any:
+        return httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=limits)
+
+    def _submit(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def _send(self, method: str, url: str, follow_redirects: bool, **kwargs: Any) -> Any:
+        retry = self.retry.new()
+        while True:
+            try:
+                request = self._client.build_request(method, url, **kwargs)
+                resp = await self._client.send(
+                    request, stream=True, follow_redirects=follow_redirects
+                )
+            except httpx.TransportError as e:
+                cause = (
+                    ConnectTimeoutError(str(e))
+                    if isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                    else ProtocolError(str(e))
+                )
+                try:
+                    retry = retry.increment(method, url, error=cause)
+                except MaxRetryError:
+                    raise _requests_error(e) from e
+                await asyncio.sleep(retry.get_backoff_time())
+                continue
+            has_retry_after = "Retry-After" in resp.headers
+            if not retry.is_retry(method, resp.status_code, has_retry_after):
+                break
+            status = _RetryResponse(resp.status_code, resp.headers)
+            try:
+                retry = retry.increment(method, url, response=status)
+            except MaxRetryError:
+                break
+            await resp.aclose()
+            delay = None
+            if retry.respect_retry_after_header and resp.status_code in Retry.RETRY_AFTER_STATUS_CODES:
+                delay = retry.get_retry_after(status)
+            await asyncio.sleep(retry.get_backoff_time() if delay is None else delay)
+        if retry.history:
+            with self.retry_lock:
+                self.retry_counts[str(resp.url)] += len(retry.history)
+        return resp
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        follow_redirects: bool,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Any = None,
+    ) -> AsyncSessionResponse:
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        resp = self._submit(
+            self._send(
+                method,
+                url,
+                follow_redirects,
+                params=params,
+                headers=headers,
+                timeout=httpx.Timeout(connect=connect, read=read, write=read, pool=None),
+            )
+        )
+        return AsyncSessionResponse(self, resp)
+
+    def get(
+        self, url: str, stream: bool = True, allow_redirects: bool = True, **kwargs: Any
+    ) -> AsyncSessionResponse:
+        # Bodies are always streamed; callers read them through iter_content or raw.
+        return self._request("GET", url, allow_redirects, **kwargs)
+
+    def head(self, url: str, allow_redirects: bool = False, **kwargs: Any) -> AsyncSessionResponse:
+        return self._request("HEAD", url, allow_redirects, **kwargs)
+
+    def close(self) -> None:
+        self._submit(self._client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
 def normalize_url(url: str) -> str:
     if "arxiv.org/abs/" in url:
         return url.replace("/abs/", "/pdf/")
@@ -483,52 +856,126 @@ def can_render_webpage_to_pdf() -> bool:
     global _WEB_RENDER_READY
     if _WEB_RENDER_READY is not None:
         return _WEB_RENDER_READY
-    try:
-        from playwright.sync_api import sync_playwright
-
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            browser.close()
-        _WEB_RENDER_READY = True
-    except Exception:
-        _WEB_RENDER_READY = False
+    # The availability check launches the same browser later render jobs reuse.
+    _WEB_RENDER_READY = get_browser_pool().available()
     return _WEB_RENDER_READY
 
 
+class ProbeMethods:
+    """Per-host memory of the cheapest PDF probe that gave a verdict.
+
+    ``head`` sends no body at all; ``range`` asks for the first KiB so the
+    ``%PDF-`` signature can be checked without opening a full download.
+    """
+
+    METHODS = ("head", "range")
+
+    def __init__(self, preferred: Optional[Dict[str, str]] = None) -> None:
+        self._preferred = {
+            host: method for host, method in (preferred or {}).items() if method in self.METHODS
+        }
+        self._lock = threading.Lock()
+
+    def order(self, url: str) -> Tuple[str, ...]:
+        with self._lock:
+            preferred = self._preferred.get(urlsplit(url).netloc.lower())
+        if preferred == "range":
+            return ("range",)
+        return self.METHODS
+
+    def record(self, url: str, method: str) -> None:
+        with self._lock:
+            self._preferred[urlsplit(url).netloc.lower()] = method
+
+    def snapshot(self) -> Dict[str, str]:
+        with self._lock:
+            return dict(self._preferred)
+
+
+_PROBE_METHODS = ProbeMethods()
+
+
+def configure_probe_methods(preferred: Optional[Dict[str, str]] = None) -> None:
+    global _PROBE_METHODS
+    _PROBE_METHODS = ProbeMethods(preferred)
+
+
+def get_probe_methods() -> ProbeMethods:
+    return _PROBE_METHODS
+
+
 def probe_source_url(session: requests.Session, url: str) -> Tuple[bool, str]:
     try:
         if is_pdf_url(url):
-            with session.get(url, timeout=20, stream=True) as resp:
-                if resp.status_code >= 400:
-                    return False, f"http_{resp.status_code}"
-                content_type = (resp.headers.get("Content-Type") or "").lower()
-                if "pdf" in content_type:
-                    return True, "pdf_content_type"
-                first_chunk = b""
-                for chunk in resp.iter_content(chunk_size=16):
-                    if chunk:
-                        first_chunk = chunk
-                        break
-                if first_chunk.startswith(b"%PDF-"):
-                    return True, "pdf_signature"
-                return False, f"not_pdf:{content_type or 'unknown'}"
-
+            with host_slot(url):
+                return _probe_pdf_url(session, url)
         if should_render_webpage_to_pdf(url):
-            resp = session.get(url, timeout=20)
-            if resp.status_code >= 400:
-                return False, f"http_{resp.status_code}"
-            content_type = (resp.headers.get("Content-Type") or "").lower()
-            if "html" not in content_type and "text" not in content_type:
-                return False, f"non_html:{content_type or 'unknown'}"
-            if not can_render_webpage_to_pdf():
-                return False, "renderer_unavailable"
-            return True, "html_renderable"
-
+            return _probe_html_url(session, url)
         return False, "unsupported_scheme"
     except Exception as e:
         return False, f"probe_error:{type(e).__name__}"
 
 
+def _probe_pdf_url(session: requests.Session, url: str) -> Tuple[bool, str]:
+    methods = get_probe_methods()
+    if "head" in methods.order(url):
+        verdict = _probe_pdf_head(session, url)
+        if verdict is not None:
+            methods.record(url, "head")
+            return verdict
+        verdict = _probe_pdf_range(session, url)
+        # Switch the host to range only when HEAD said nothing and the GET found
+        # a PDF; dead links and login walls say nothing about which method works.
+        if verdict[0]:
+            methods.record(url, "range")
+        return verdict
+    return _probe_pdf_range(session, url)
+
+
+def _probe_pdf_head(session: requests.Session, url: str) -> Optional[Tuple[bool, str]]:
+    # Only a PDF Content-Type is conclusive; 405s, octet-stream and friends fall through.
+    resp = session.head(url, timeout=request_timeout(session), allow_redirects=True)
+    resp.close()
+    if resp.status_code < 400 and "pdf" in (resp.headers.get("Content-Type") or "").lower():
+        return True, "pdf_content_type"
+    return None
+
+
+def _probe_pdf_range(session: requests.Session, url: str) -> Tuple[bool, str]:
+    with session.get(
+        url,
+        timeout=request_timeout(session),
+        stream=True,
+        headers={"Range": "bytes=0-1023"},
+    ) as resp:
+        if resp.status_code >= 400:
+            return False, f"http_{resp.status_code}"
+        content_type = (resp.headers.get("Content-Type") or "").lower()
+        if "pdf" in content_type:
+            return True, "pdf_content_type"
+        first_chunk = b""
+        for chunk in resp.iter_content(chunk_size=16):
+            if chunk:
+                first_chunk = chunk
+                break
+        if first_chunk.startswith(b"%PDF-"):
+            return True, "pdf_signature"
+        return False, f"not_pdf:{content_type or 'unknown'}"
+
+
+def _probe_html_url(session: requests.Session, url: str) -> Tuple[bool, str]:
+    head = get_html_head(session, url)
+    if head.error:
+        return False, f"probe_error:{head.error}"
+    if head.status_code >= 400:
+        return False, f"http_{head.status_code}"
+    if not head.is_text:
+        return False, f"non_html:{head.content_type or 'unknown'}"
+    if not can_render_webpage_to_pdf():
+        return False, "renderer_unavailable"
+    return True, "html_renderable"
+
+
 def choose_best_source_url(
     session: requests.Session,
     record: Dict[str, Any],
@@ -558,6 +1005,29 @@ def choose_best_source_url(
     return url, f"probe_fail_fallback:{reason}|priority={base}"
 
 
+def prefetch_probe_results(
+    session: requests.Session,
+    records: List[Dict[str, Any]],
+    probe_cache: Dict[str, Tuple[bool, str]],
+    jobs: int = 1,
+) -> None:
+    # Dedupe candidates across all records so each URL is probed once per run.
+    pending: List[str] = []
+    seen = set(probe_cache)
+    for record in records:
+        for url in collect_candidate_links(record):
+            if url in seen:
+                continue
+            seen.add(url)
+            pending.append(url)
+    if not pending:
+        return
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        outcomes = list(pool.map(lambda u: probe_source_url(session, u), pending))
+    for url, outcome in zip(pending, outcomes):
+        probe_cache[url] = outcome
+
+
 def extract_arxiv_id(url: str) -> Optional[str]:
     m = re.search(r"arxiv\.org/(?:abs|pdf)/([0-9]{4}\.[0-9]{4,5})(?:v\d+)?", url)
     if not m:
@@ -565,17 +1035,16 @@ def extract_arxiv_id(url: str) -> Optional[str]:
     return m.group(1)
 
 
+_FULL_DATE_RE = re.compile(r"(20\d{2})[-/\.](0?[1-9]|1[0-2])[-/\.](0?[1-9]|[12]\d|3[01])")
+_YEAR_MONTH_RE = re.compile(r"(20\d{2})[-/\.](0?[1-9]|1[0-2])")
+
+
 def extract_year_month_from_text(text: str) -> Optional[str]:
     if not text:
         return None
-    patterns = [
-        # YYYY-MM-DD / YYYY/MM/DD / YYYY.MM.DD
-        r"(20\d{2})[-/\.](0?[1-9]|1[0-2])[-/\.](0?[1-9]|[12]\d|3[01])",
-        # YYYY-MM / YYYY/MM / YYYY.MM
-        r"(20\d{2})[-/\.](0?[1-9]|1[0-2])",
-    ]
-    for p in patterns:
-        m = re.search(p, text)
+    # YYYY-MM-DD / YYYY/MM/DD / YYYY.MM.DD, then YYYY-MM / YYYY/MM / YYYY.MM
+    for pattern in (_FULL_DATE_RE, _YEAR_MONTH_RE):
+        m = pattern.search(text)
         if m:
             return f"{m.group(1)}-{int(m.group(2)):02d}"
     return None
@@ -585,49 +1054,247 @@ def extract_year_month_from_url(url: str) -> Optional[str]:
     return extract_year_month_from_text(url)
 
 
+def _atom_text(entry: ElementTree.Element, tag: str) -> str:
+    return " ".join((entry.findtext(f"{{{ATOM_NS}}}{tag}") or "").split())
+
+
+def parse_arxiv_feed(stream) -> Dict[str, Dict[str, Any]]:
+    """Stream-parse an arXiv Atom feed into per-id metadata, one entry in memory at a time."""
+    entries: Dict[str, Dict[str, Any]] = {}
+    for _, elem in ElementTree.iterparse(stream, events=("end",)):
+        if elem.tag != f"{{{ATOM_NS}}}entry":
+            continue
+        raw_id = _atom_text(elem, "id")
+        arxiv_id = extract_arxiv_id(raw_id)
+        version = re.search(r"v(\d+)$", raw_id)
+        published = _atom_text(elem, "published")
+        if arxiv_id and re.match(r"^\d{4}-\d{2}-\d{2}T", published):
+            entries[arxiv_id] = {
+                "arxiv_id": arxiv_id,
+                "version": int(version.group(1)) if version else 1,
+                "title": _atom_text(elem, "title"),
+                "authors": [
+                    " ".join((a.findtext(f"{{{ATOM_NS}}}name") or "").split())
+                    for a in elem.findall(f"{{{ATOM_NS}}}author")
+                ],
+                "abstract": _atom_text(elem, "summary"),
+                "published": published[:10],
+                "updated": _atom_text(elem, "updated")[:10],
+            }
+        elem.clear()
+    return entries
+
+
+def fetch_arxiv_metadata(
+    session: requests.Session, arxiv_ids: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """Resolve many arXiv ids with comma-separated id_list queries."""
+    metadata: Dict[str, Dict[str, Any]] = {}
+    unique_ids = list(dict.fromkeys(arxiv_ids))
+    for start in range(0, len(unique_ids), ARXIV_BATCH_SIZE):
+        batch = unique_ids[start : start + ARXIV_BATCH_SIZE]
+        try:
+            with host_slot(ARXIV_API_URL), session.get(
+                ARXIV_API_URL,
+                params={"id_list": ",".join(batch), "max_results": len(batch)},
+                timeout=request_timeout(session),
+                stream=True,
+            ) as resp:
+                resp.raise_for_status()
+                resp.raw.decode_content = True
+                metadata.update(parse_arxiv_feed(resp.raw))
+        except Exception:
+            continue
+    return metadata
+
+
+def fetch_arxiv_published_months(
+    session: requests.Session, arxiv_ids: List[str]
+) -> Dict[str, str]:
+    return {
+        arxiv_id: meta["published"][:7]
+        for arxiv_id, meta in fetch_arxiv_metadata(session, arxiv_ids).items()
+    }
+
+
 def fetch_arxiv_published_month(session: requests.Session, arxiv_id: str) -> Optional[str]:
+    return fetch_arxiv_published_months(session, [arxiv_id]).get(arxiv_id)
+
+
+def prefetch_release_months(
+    session: requests.Session,
+    links: List[str],
+    link_frequency: Dict[str, int],
+    cache: Dict[str, Tuple[Optional[str], str]],
+    arxiv_metadata: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> None:
+    # One batched query covers every arXiv link: months fill the cache for links
+    # resolve_release_month would look up, metadata is kept for all of them.
+    arxiv_ids = [i for i in (extract_arxiv_id(url) for url in links if url) if i]
+    if not arxiv_ids:
+        return
+    metadata = fetch_arxiv_metadata(session, arxiv_ids)
+    if arxiv_metadata is not None:
+        arxiv_metadata.update(metadata)
+    for url in links:
+        arxiv_id = extract_arxiv_id(url) if url else None
+        if not arxiv_id or arxiv_id not in metadata:
+            continue
+        if url in cache or link_frequency.get(url, 0) > 1:
+            continue
+        cache[url] = (metadata[arxiv_id]["published"][:7], "arxiv_published")
+
+
+_DATE_YMD = r"(20\d{2})[-/\.](0?[1-9]|1[0-2])[-/\.](?:0?[1-9]|[12]\d|3[01])"
+# Tried in preference order, each over the whole page: a hit for an earlier rule
+# wins wherever it sits. The first two are structured metadata.
+_WEB_DATE_RULES = [
+    # OpenGraph / metadata published date
+    re.compile(r"article:published_time[^>]*content=[\"']" + _DATE_YMD, re.IGNORECASE),
+    # JSON-LD / inline script datePublished
+    re.compile(r"datePublished[\"']?\s*[:=]\s*[\"']" + _DATE_YMD, re.IGNORECASE),
+    # Common inline date blocks like 2026/02/16 · ...
+    re.compile(_DATE_YMD + r"\s*[·|\\-]"),
+    # Keyword-near-date fallback
+    re.compile(r"(?:published|release(?:d)?|date)\D{0,30}" + _DATE_YMD, re.IGNORECASE),
+]
+WEB_DATE_SCAN_LIMIT = 300000
+
+
+class WebDateScanner:
+    """Incremental published-month matcher over decoded HTML fed in chunks.
+
+    Only text added since the last chunk (plus a short overlap) is searched,
+    and each rule keeps its first hit, so ``result`` follows the rule order.
+    ``feed`` returns True once no later text can change the answer: the
+    OpenGraph date matched, or ``datePublished`` matched and ``</head>`` (where
+    that meta tag lives) has passed.
+    """
+
+    OVERLAP = 512
+
+    def __init__(self, limit: int = WEB_DATE_SCAN_LIMIT) -> None:
+        self.limit = limit
+        self.text = ""
+        self._found: Dict[int, str] = {}
+        self._head_closed = False
+
+    @property
+    def done(self) -> bool:
+        if 0 in self._found or len(self.text) >= self.limit:
+            return True
+        return 1 in self._found and self._head_closed
+
+    def feed(self, chunk: str) -> bool:
+        if self.done or not chunk:
+            return self.done
+        # Rescan a short tail so matches split across chunks are still seen.
+        start = max(0, len(self.text) - self.OVERLAP)
+        self.text = (self.text + chunk)[: self.limit]
+        for rank, pattern in enumerate(_WEB_DATE_RULES):
+            if rank in self._found:
+                continue
+            m = pattern.search(self.text, start)
+            if m:
+                self._found[rank] = f"{m.group(1)}-{int(m.group(2)):02d}"
+        if not self._head_closed:
+            self._head_closed = "</head>" in self.text[start:].lower()
+        return self.done
+
+    def result(self) -> Optional[str]:
+        return self._found[min(self._found)] if self._found else None
+
+
+class HtmlHead:
+    """What one streamed read of an HTML page told us: status, type and date."""
+
+    def __init__(
+        self,
+        status_code: int = 0,
+        content_type: str = "",
+        published_month: Optional[str] = None,
+        bytes_read: int = 0,
+        error: Optional[str] = None,
+    ) -> None:
+        self.status_code = status_code
+        self.content_type = content_type
+        self.published_month = published_month
+        self.bytes_read = bytes_read
+        self.error = error
+
+    @property
+    def is_text(self) -> bool:
+        return "html" in self.content_type or "text" in self.content_type
+
+
+class HtmlHeadFetcher:
+    """Read each HTML page once, for both the source probe and date inference.
+
+    The body is streamed only until the date scanner can no longer change its
+    answer (see ``WebDateScanner``) or ``byte_budget`` bytes were read.
+    """
+
+    def __init__(self, byte_budget: int = WEB_DATE_SCAN_LIMIT) -> None:
+        self.byte_budget = byte_budget
+        self._heads: Dict[str, HtmlHead] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, session: requests.Session, url: str) -> HtmlHead:
+        with self._lock:
+            key_lock = self._locks.setdefault(url, threading.Lock())
+        with key_lock:
+            if url not in self._heads:
+                with host_slot(url):
+                    self._heads[url] = self._fetch(session, url)
+            return self._heads[url]
+
+    def _fetch(self, session: requests.Session, url: str) -> HtmlHead:
+        head = HtmlHead()
+        scanner = WebDateScanner(limit=self.byte_budget)
+        try:
+            with session.get(url, timeout=request_timeout(session), stream=True) as resp:
+                head.status_code = resp.status_code
+                head.content_type = (resp.headers.get("Content-Type") or "").lower()
+                if resp.status_code >= 400 or not head.is_text:
+                    return head
+                decoder = _incremental_decoder(resp.encoding)
+                for chunk in resp.iter_content(chunk_size=16384):
+                    head.bytes_read += len(chunk)
+                    text = decoder.decode(chunk)
+                    if scanner.feed(text) or head.bytes_read >= self.byte_budget:
+                        break
+        except Exception as e:
+            head.error = type(e).__name__
+        head.published_month = scanner.result()
+        return head
+
+
+_HTML_HEADS = HtmlHeadFetcher()
+
+
+def configure_html_head_budget(byte_budget: int = WEB_DATE_SCAN_LIMIT) -> None:
+    # Fresh fetcher per run so a long-lived process never serves stale pages.
+    global _HTML_HEADS
+    _HTML_HEADS = HtmlHeadFetcher(max(1024, byte_budget))
+
+
+def get_html_head(session: requests.Session, url: str) -> HtmlHead:
+    return _HTML_HEADS.get(session, url)
+
+
+def _incremental_decoder(encoding: Optional[str]) -> codecs.IncrementalDecoder:
     try:
-        resp = session.get(
-            "https://export.arxiv.org/api/query",
-            params={"id_list": arxiv_id},
-            timeout=20,
-        )
-        resp.raise_for_status()
-    except Exception:
-        return None
-    m = re.search(r"<published>(\d{4})-(\d{2})-\d{2}T", resp.text)
-    if not m:
-        return None
-    return f"{m.group(1)}-{m.group(2)}"
+        return codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+    except LookupError:
+        return codecs.getincrementaldecoder("utf-8")(errors="replace")
 
 
 def fetch_webpage_published_month(session: requests.Session, url: str) -> Optional[str]:
-    try:
-        resp = session.get(url, timeout=20)
-        resp.raise_for_status()
-    except Exception:
+    head = get_html_head(session, url)
+    if head.error or head.status_code >= 400:
         return None
-
-    body = resp.text[:300000]
-    patterns = [
-        # OpenGraph / metadata published date
-        r'(?i)article:published_time[^>]*content=["\'](20\d{2})[-/\.](0?[1-9]|1[0-2])[-/\.](0?[1-9]|[12]\d|3[01])',
-        r'(?i)datePublished["\']?\s*[:=]\s*["\'](20\d{2})[-/\.](0?[1-9]|1[0-2])[-/\.](0?[1-9]|[12]\d|3[01])',
-        # Common inline date blocks like 2026/02/16 · ...
-        r"(20\d{2})[-/\.](0?[1-9]|1[0-2])[-/\.](0?[1-9]|[12]\d|3[01])\s*[·|\\-]",
-        # Keyword-near-date fallback
-        r'(?i)(published|release(?:d)?|date)\D{0,30}(20\d{2})[-/\.](0?[1-9]|1[0-2])[-/\.](0?[1-9]|[12]\d|3[01])',
-    ]
-    for p in patterns:
-        m = re.search(p, body)
-        if not m:
-            continue
-        if len(m.groups()) == 3:
-            year, month = m.group(1), m.group(2)
-        else:
-            year, month = m.group(2), m.group(3)
-        return f"{year}-{int(month):02d}"
-    return None
+    return head.published_month
 
 
 def infer_release_month_from_source(
@@ -674,6 +1341,87 @@ def resolve_release_month(
     return declared_release_date, "manual_fallback"
 
 
+def is_transient_probe_reason(reason: str) -> bool:
+    # Errors, throttling, server faults and a missing local renderer say nothing
+    # lasting about the URL, so they are never cached across runs.
+    if reason.startswith("probe_error:") or reason == "renderer_unavailable":
+        return True
+    m = re.match(r"^http_(\d{3})$", reason)
+    return bool(m) and (m.group(1) == "429" or m.group(1).startswith("5"))
+
+
+class SourceCache:
+    """JSON-lines store for probe and release-month results across runs."""
+
+    def __init__(self, path: Path, probe_ttl_seconds: float, refresh: bool = False) -> None:
+        self.path = path
+        self.probe_ttl_seconds = probe_ttl_seconds
+        self.refresh = refresh
+        self.probe_methods: Dict[str, str] = {}
+        self._fetched_at: Dict[Tuple[str, str], float] = {}
+
+    def load(
+        self, now: Optional[float] = None
+    ) -> Tuple[Dict[str, Tuple[bool, str]], Dict[str, Tuple[Optional[str], str]]]:
+        probe_cache: Dict[str, Tuple[bool, str]] = {}
+        release_month_cache: Dict[str, Tuple[Optional[str], str]] = {}
+        if self.refresh or not self.path.exists():
+            return probe_cache, release_month_cache
+        now = time.time() if now is None else now
+        for line in self.path.read_text(encoding="utf-8").splitlines():
+            try:
+                entry = json.loads(line)
+                kind, url, value = entry["kind"], normalize_url(entry["url"]), entry["value"]
+                fetched_at = float(entry["fetched_at"])
+            except Exception:
+                continue
+            if kind == "probe_method":
+                if now - fetched_at <= self.probe_ttl_seconds:
+                    self.probe_methods[entry["url"]] = str(value)
+                    self._fetched_at[(kind, entry["url"])] = fetched_at
+            elif kind == "release_month":
+                permanent = value[1] in PERMANENT_RELEASE_SOURCES
+                if permanent or now - fetched_at <= self.probe_ttl_seconds:
+                    release_month_cache[url] = (value[0], value[1])
+                    self._fetched_at[(kind, url)] = fetched_at
+            elif kind == "probe" and now - fetched_at <= self.probe_ttl_seconds:
+                probe_cache[url] = (bool(value[0]), str(value[1]))
+                self._fetched_at[(kind, url)] = fetched_at
+        return probe_cache, release_month_cache
+
+    def save(
+        self,
+        probe_cache: Dict[str, Tuple[bool, str]],
+        release_month_cache: Dict[str, Tuple[Optional[str], str]],
+        now: Optional[float] = None,
+        probe_methods: Optional[Dict[str, str]] = None,
+    ) -> None:
+        now = time.time() if now is None else now
+        if probe_methods is not None:
+            self.probe_methods = dict(probe_methods)
+        lines: List[str] = []
+        entries: List[Tuple[str, str, Any]] = [
+            ("probe", url, value) for url, value in probe_cache.items()
+        ]
+        entries += [("release_month", url, value) for url, value in release_month_cache.items()]
+        entries += [("probe_method", host, method) for host, method in self.probe_methods.items()]
+        for kind, url, value in sorted(entries, key=lambda e: (e[0], e[1])):
+            # Transient network errors are worth retrying next run.
+            if kind == "probe" and is_transient_probe_reason(str(value[1])):
+                continue
+            fetched_at = self._fetched_at.get((kind, url), now)
+            if kind != "probe_method":
+                value = list(value)
+            lines.append(
+                json.dumps(
+                    {"kind": kind, "url": url, "value": value, "fetched_at": fetched_at},
+                    ensure_ascii=False,
+                )
+            )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+
+
 def is_pdf_url(url: str) -> bool:
     url_l = url.lower()
     return (
@@ -694,52 +1442,546 @@ def slugify_model(name: str) -> str:
     return s
 
 
+@contextmanager
+def open_pdf_view(path: Path) -> Iterator[Optional[mmap.mmap]]:
+    """Read-only memory map of a PDF (None when empty).
+
+    Only the pages of the file that are actually sliced or parsed get
+    faulted in, so header/trailer checks and first-page extraction keep
+    memory flat no matter how large the PDF is.
+    """
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield None
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            yield view
+
+
 def has_pdf_signature(path: Path) -> bool:
     try:
-        with path.open("rb") as f:
-            return f.read(5).startswith(b"%PDF-")
+        with open_pdf_view(path) as view:
+            return view is not None and view[:5] == b"%PDF-"
     except Exception:
         return False
 
 
-def extract_text_length_from_pdf(path: Path, max_pages: int = 5) -> int:
-    if not path.exists() or PdfReader is None:
-        return 0
+def has_pdf_trailer(path: Path) -> bool:
     try:
-        reader = PdfReader(str(path))
-        total = 0
-        for page in reader.pages[:max_pages]:
-            total += len((page.extract_text() or "").strip())
-        return total
+        with open_pdf_view(path) as view:
+            # The spec puts the trailer marker within the last 1024 bytes.
+            return view is not None and view.rfind(b"%%EOF", max(0, len(view) - 1024)) != -1
     except Exception:
-        return 0
+        return False
+
+
+def _extract_pdf_pages(
+    path: str, start: int, max_pages: int, min_chars: Optional[int], prior_chars: int
+) -> Tuple[List[str], int]:
+    # Top-level so it can run inside a ProcessPoolExecutor worker.
+    pages: List[str] = []
+    with open_pdf_view(Path(path)) as view:
+        if view is None:
+            raise ValueError(f"empty PDF: {path}")
+        # A path would make pypdf read the whole file into memory; the map is paged lazily.
+        reader = PdfReader(view)
+        total_pages = len(reader.pages)
+        chars = prior_chars
+        for index in range(start, min(max_pages, total_pages)):
+            text = (reader.pages[index].extract_text() or "").strip()
+            pages.append(text)
+            chars += len(text)
+            if min_chars is not None and chars >= min_chars:
+                break
+        del reader
+    return pages, total_pages
+
+
+class TextExtractor:
+    """Memoized, budgeted pypdf text extraction.
+
+    Pages are extracted lazily and remembered per file (path, size, mtime);
+    with a ``cache_dir`` the page texts are also persisted by SHA-256 so later
+    runs and the search index can reuse them without reparsing. pypdf work
+    runs in ``executor`` (typically a process pool) when one is given.
+    """
+
+    def __init__(
+        self, cache_dir: Optional[Path] = None, executor: Optional[Executor] = None
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.executor = executor
+        self._lock = threading.Lock()
+        self._memo: Dict[Tuple[str, int, int], Tuple[List[str], bool]] = {}
+
+    def _cache_file(self, digest: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / digest[:2] / f"{digest}.json"
+
+    def _load_persisted(self, digest: str) -> Optional[Tuple[List[str], bool]]:
+        cache_file = self._cache_file(digest)
+        if cache_file is None or not cache_file.exists():
+            return None
+        try:
+            raw = json.loads(cache_file.read_text(encoding="utf-8"))
+            return [str(p) for p in raw["pages"]], bool(raw["exhausted"])
+        except Exception:
+            return None
+
+    def _persist(self, digest: str, pages: List[str], exhausted: bool) -> None:
+        cache_file = self._cache_file(digest)
+        if cache_file is None:
+            return
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_name(cache_file.name + ".tmp")
+        tmp.write_text(
+            json.dumps({"pages": pages, "exhausted": exhausted}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        tmp.replace(cache_file)
+
+    @staticmethod
+    def _satisfied(
+        pages: List[str], exhausted: bool, max_pages: int, min_chars: Optional[int]
+    ) -> bool:
+        if exhausted or len(pages) >= max_pages:
+            return True
+        return min_chars is not None and sum(len(p) for p in pages) >= min_chars
+
+    def pages(self, path: Path, max_pages: int = 5, min_chars: Optional[int] = None) -> List[str]:
+        """Return stripped page texts, stopping early once ``min_chars`` is reached."""
+        if not path.exists() or PdfReader is None:
+            return []
+        stat = path.stat()
+        key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            cached = self._memo.get(key)
+        digest = ""
+        if cached is None and self.cache_dir is not None:
+            digest = file_sha256(path)
+            cached = self._load_persisted(digest)
+        pages, exhausted = cached if cached is not None else ([], False)
+        pages = list(pages)
+
+        if not self._satisfied(pages, exhausted, max_pages, min_chars):
+            args = (str(path), len(pages), max_pages, min_chars, sum(len(p) for p in pages))
+            try:
+                if self.executor is not None:
+                    new_pages, total_pages = self.executor.submit(_extract_pdf_pages, *args).result()
+                else:
+                    new_pages, total_pages = _extract_pdf_pages(*args)
+            except Exception:
+                return []
+            pages.extend(new_pages)
+            exhausted = len(pages) >= total_pages
+            if self.cache_dir is not None:
+                self._persist(digest or file_sha256(path), pages, exhausted)
+        with self._lock:
+            self._memo[key] = (pages, exhausted)
+
+        selected: List[str] = []
+        for text in pages[:max_pages]:
+            selected.append(text)
+            if min_chars is not None and sum(len(p) for p in selected) >= min_chars:
+                break
+        return selected
+
+    def text_length(self, path: Path, max_pages: int = 5, min_chars: Optional[int] = None) -> int:
+        return sum(len(p) for p in self.pages(path, max_pages=max_pages, min_chars=min_chars))
+
+
+_TEXT_EXTRACTOR = TextExtractor()
+
+
+def new_extract_pool(max_workers: int) -> ProcessPoolExecutor:
+    # Workers start lazily from pipeline threads while the browser loop, urllib3
+    # pools and host locks are live; forking that state can deadlock.
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+
+
+def configure_text_cache(cache_dir: Optional[Path], executor: Optional[Executor] = None) -> None:
+    global _TEXT_EXTRACTOR
+    _TEXT_EXTRACTOR = TextExtractor(cache_dir, executor=executor)
+
+
+def get_text_extractor() -> TextExtractor:
+    return _TEXT_EXTRACTOR
+
+
+def extract_text_length_from_pdf(path: Path, max_pages: int = 5) -> int:
+    return _TEXT_EXTRACTOR.text_length(path, max_pages=max_pages)
 
 
 def looks_like_text_pdf(path: Path, min_chars: int) -> bool:
-    return extract_text_length_from_pdf(path) >= min_chars
+    # Only parse as many pages as it takes to reach the budget.
+    return _TEXT_EXTRACTOR.text_length(path, min_chars=min_chars) >= min_chars
+
+
+def _relative_to_root(path: Path) -> str:
+    try:
+        return str(path.relative_to(ROOT))
+    except ValueError:
+        return str(path)
+
+
+class DownloadManifest:
+    """Per-URL record of the HTTP validators and local file of the last download."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if path.exists():
+            try:
+                raw = json.loads(path.read_text(encoding="utf-8"))
+            except Exception:
+                raw = {}
+            if isinstance(raw, dict):
+                self.entries = {k: v for k, v in raw.items() if isinstance(v, dict)}
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self.entries.get(url)
+            return dict(entry) if entry else None
+
+    def update(self, url: str, **fields: Any) -> None:
+        with self._lock:
+            self.entries.setdefault(url, {}).update(fields)
+
+    def save(self) -> None:
+        with self._lock:
+            payload = json.dumps(self.entries, ensure_ascii=False, indent=2, sort_keys=True)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(payload + "\n", encoding="utf-8")
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_local_artifact_current(entry: Optional[Dict[str, Any]], output: Path) -> bool:
+    # Shared links map several outputs to one entry, so match on content, not path.
+    if not entry or not output.exists():
+        return False
+    if output.stat().st_size != entry.get("content_length"):
+        return False
+    if not has_pdf_signature(output):
+        return False
+    return bool(entry.get("sha256")) and file_sha256(output) == entry["sha256"]
+
+
+def is_arxiv_version_stale(entry: Optional[Dict[str, Any]], meta: Optional[Dict[str, Any]]) -> bool:
+    # A new vN behind an unversioned arXiv link changes the PDF without touching our copy.
+    if not entry or not meta or "arxiv_version" not in entry:
+        return False
+    return int(meta["version"]) > int(entry["arxiv_version"])
+
+
+def _record_artifact(
+    manifest: Optional[DownloadManifest], url: str, output: Path, **fields: Any
+) -> None:
+    if manifest is None:
+        return
+    fields.setdefault("sha256", file_sha256(output))
+    manifest.update(
+        url,
+        path=_relative_to_root(output),
+        content_length=output.stat().st_size,
+        **fields,
+    )
+
+
+def _conditional_headers(entry: Optional[Dict[str, Any]], output: Path) -> Dict[str, str]:
+    # Only revalidate when the local copy is the one the validators describe.
+    if not is_local_artifact_current(entry, output):
+        return {}
+    headers: Dict[str, str] = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+class PdfStore:
+    """Content-addressed blob store; archive paths are materialized as links.
+
+    ``hardlink`` (copy across devices) and ``copy`` keep archive paths as
+    regular files git can commit. ``symlink`` points them into the store,
+    which is gitignored, so it only suits scratch checkouts.
+    """
+
+    LINK_MODES = ("hardlink", "symlink", "copy")
+
+    def __init__(self, root: Path, link_mode: str = "hardlink") -> None:
+        if link_mode not in self.LINK_MODES:
+            raise ValueError(f"unsupported link mode: {link_mode}")
+        self.root = root
+        self.link_mode = link_mode
+
+    def blob_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}.pdf"
+
+    def has(self, digest: str) -> bool:
+        return self.blob_path(digest).exists()
+
+    def ingest(self, path: Path, *mirrors: Path) -> str:
+        digest = file_sha256(path)
+        blob = self.blob_path(digest)
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            # Concurrent writers of one digest each use their own temp file and
+            # publish with a no-clobber link, so the first blob wins and earlier
+            # links into it stay valid.
+            tmp = self._temp_path(blob.parent, blob.name, ".tmp")
+            try:
+                shutil.copyfile(path, tmp)
+                try:
+                    os.link(tmp, blob)
+                except FileExistsError:
+                    pass
+                except OSError:
+                    if not blob.exists():
+                        tmp.replace(blob)
+            finally:
+                tmp.unlink(missing_ok=True)
+        for dest in (path, *mirrors):
+            self.materialize(digest, dest)
+        return digest
+
+    def materialize(self, digest: str, dest: Path) -> None:
+        blob = self.blob_path(digest)
+        if dest.exists() and not dest.is_symlink() and os.path.samefile(blob, dest):
+            return
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._temp_path(dest.parent, dest.name, ".link")
+        tmp.unlink()
+        mode = self.link_mode
+        if mode == "hardlink":
+            try:
+                os.link(blob, tmp)
+            except OSError:
+                # Cross-device or unsupported filesystem.
+                mode = "copy"
+        if mode == "symlink":
+            tmp.symlink_to(os.path.relpath(blob, dest.parent))
+        elif mode == "copy":
+            shutil.copyfile(blob, tmp)
+        tmp.replace(dest)
+
+    @staticmethod
+    def _temp_path(directory: Path, name: str, suffix: str) -> Path:
+        fd, tmp_name = tempfile.mkstemp(prefix=f"{name}.", suffix=suffix, dir=directory)
+        os.close(fd)
+        return Path(tmp_name)
+
+
+class SharedFetches:
+    """Runs each fetch once per key; later callers reuse the first result."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._done: Dict[str, threading.Event] = {}
+        self._results: Dict[str, Tuple[Any, Path]] = {}
+
+    def run(self, key: str, output: Path, fetch) -> Tuple[Any, Path]:
+        with self._lock:
+            event = self._done.get(key)
+            owner = event is None
+            if owner:
+                event = threading.Event()
+                self._done[key] = event
+        if owner:
+            try:
+                self._results[key] = (fetch(), output)
+            finally:
+                event.set()
+        event.wait()
+        return self._results[key]
+
+
+def copy_shared_output(source: Path, output: Path) -> None:
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_name(output.name + ".tmp")
+    shutil.copyfile(source, tmp)
+    tmp.replace(output)
 
 
-def download_file(session: requests.Session, url: str, output: Path) -> Tuple[bool, str]:
+class PdfStreamCheck:
+    """Validates a PDF while it streams: signature, SHA-256, size and %%EOF trailer."""
+
+    def __init__(self) -> None:
+        self.digest = hashlib.sha256()
+        self.size = 0
+        self.rejected = ""
+        self._head = b""
+        self._tail = b""
+
+    def feed(self, chunk: bytes) -> bool:
+        """Consume a chunk; returns False once the stream is known not to be a PDF."""
+        if len(self._head) < 5:
+            self._head += chunk[: 5 - len(self._head)]
+            if len(self._head) == 5 and not self.signature_ok:
+                self.rejected = "not_pdf"
+                return False
+        self.digest.update(chunk)
+        self.size += len(chunk)
+        self._tail = (self._tail + chunk)[-1024:]
+        return True
+
+    def finish(self) -> bool:
+        if not self.rejected and not self.signature_ok:
+            self.rejected = "not_pdf"
+        elif not self.rejected and not self.has_eof:
+            self.rejected = "truncated"
+        return not self.rejected
+
+    @property
+    def signature_ok(self) -> bool:
+        return self._head.startswith(b"%PDF-")
+
+    @property
+    def has_eof(self) -> bool:
+        # The spec puts the trailer marker within the last 1024 bytes.
+        return b"%%EOF" in self._tail
+
+    def hexdigest(self) -> str:
+        return self.digest.hexdigest()
+
+
+def partial_download_path(output: Path) -> Path:
+    return output.with_name(output.name + ".part")
+
+
+def partial_validators_path(output: Path) -> Path:
+    # Sidecar holding the validators of the response a .part was started from.
+    return output.with_name(output.name + ".part.json")
+
+
+def _discard_partial(output: Path) -> None:
+    partial_download_path(output).unlink(missing_ok=True)
+    partial_validators_path(output).unlink(missing_ok=True)
+
+
+def _if_range_validator(output: Path) -> Optional[str]:
+    try:
+        saved = json.loads(partial_validators_path(output).read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    etag = saved.get("etag") or ""
+    # Weak ETags are not allowed in If-Range.
+    if etag and not etag.startswith("W/"):
+        return etag
+    return saved.get("last_modified") or None
+
+
+class _RangeNotSatisfiable(Exception):
+    pass
+
+
+def download_file(
+    session: requests.Session,
+    url: str,
+    output: Path,
+    manifest: Optional[DownloadManifest] = None,
+    check: Optional[PdfStreamCheck] = None,
+) -> Tuple[bool, str]:
     output.parent.mkdir(parents=True, exist_ok=True)
+    check = check if check is not None else PdfStreamCheck()
+    part = partial_download_path(output)
+    entry = manifest.get(url) if manifest is not None else None
+    conditional = _conditional_headers(entry, output)
+    headers = dict(conditional)
+    # Only resume when the server can confirm the part still matches the remote
+    # file; a changed file answers If-Range with a full 200 and we start over.
+    if_range = _if_range_validator(output) if part.exists() else None
+    resume_from = part.stat().st_size if if_range else 0
+    if resume_from:
+        headers["Range"] = f"bytes={resume_from}-"
+        headers["If-Range"] = if_range
     try:
         content_type = ""
-        with session.get(url, timeout=20, stream=True) as resp:
+        with host_slot(url), session.get(url, timeout=request_timeout(session), stream=True, headers=headers) as resp:
+            if resp.status_code == 304 and conditional:
+                _discard_partial(output)
+                return True, str(entry.get("content_type", ""))
+            if resp.status_code == 416:
+                # Usually the part already holds the whole file (a crash before the
+                # rename); drop it and fetch from scratch once, outside the host slot.
+                _discard_partial(output)
+                if resume_from:
+                    raise _RangeNotSatisfiable()
+                return False, ""
             resp.raise_for_status()
             content_type = resp.headers.get("Content-Type", "")
-            with output.open("wb") as f:
+            content_range = resp.headers.get("Content-Range", "")
+            resumed = (
+                resume_from > 0
+                and resp.status_code == 206
+                and content_range.startswith(f"bytes {resume_from}-")
+            )
+            if resumed:
+                with part.open("rb") as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b""):
+                        check.feed(chunk)
+            else:
+                partial_validators_path(output).write_text(
+                    json.dumps(
+                        {
+                            "etag": resp.headers.get("ETag"),
+                            "last_modified": resp.headers.get("Last-Modified"),
+                        }
+                    ),
+                    encoding="utf-8",
+                )
+            with part.open("ab" if resumed else "wb") as f:
                 for chunk in resp.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-        success = output.exists() and output.stat().st_size > 0
-        return success, content_type
+                    if not chunk:
+                        continue
+                    if not check.feed(chunk):
+                        # Login walls and HTML error pages fail on the first bytes.
+                        break
+                    f.write(chunk)
+            response_headers = resp.headers
+        if not check.finish():
+            _discard_partial(output)
+            return False, content_type
+        # The final path only ever holds a completed, validated transfer.
+        part.replace(output)
+        partial_validators_path(output).unlink(missing_ok=True)
+        _record_artifact(
+            manifest,
+            url,
+            output,
+            sha256=check.hexdigest(),
+            etag=response_headers.get("ETag"),
+            last_modified=response_headers.get("Last-Modified"),
+            content_type=content_type,
+        )
+        return True, content_type
+    except _RangeNotSatisfiable:
+        # No part is left, so this retry sends no Range and cannot loop.
+        return download_file(session, url, output, manifest=manifest, check=check)
+    except requests.HTTPError as e:
+        status = e.response.status_code if e.response is not None else 0
+        if 400 <= status < 500:
+            _discard_partial(output)
+        # 5xx after retries is transient; keep the part for the next run.
+        return False, ""
     except Exception:
-        if output.exists():
-            output.unlink(missing_ok=True)
+        # Keep the partial file so the next run can resume with a Range request.
         return False, ""
 
 
-def _expand_common_read_more(page) -> None:
-    page.evaluate(
+async def _expand_common_read_more(page) -> None:
+    await page.evaluate(
         """
         () => {
             const keys = [
@@ -759,27 +2001,106 @@ def _expand_common_read_more(page) -> None:
     )
 
 
-def _scroll_until_stable(page, max_rounds: int = 30) -> None:
+_TRACK_DOM_MUTATIONS_JS = """
+() => {
+    if (window.__reportLastMutation !== undefined) return;
+    window.__reportLastMutation = performance.now();
+    new MutationObserver(() => { window.__reportLastMutation = performance.now(); }).observe(
+        document.documentElement,
+        { childList: true, subtree: true, attributes: true, characterData: true }
+    );
+}
+"""
+_DOM_QUIET_JS = "(quietMs) => performance.now() - window.__reportLastMutation >= quietMs"
+_PAGE_HEIGHT_JS = "Math.max(document.body.scrollHeight, document.documentElement.scrollHeight)"
+
+
+class _InflightRequests:
+    """Counts a page's in-flight requests from Playwright's request events.
+
+    ``networkidle`` is a one-shot lifecycle state that stays resolved after the
+    first load, so XHRs started by scrolling have to be tracked directly.
+    """
+
+    def __init__(self, page) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._pending: set = set()
+        self._last_change = self._loop.time()
+        page.on("request", self._started)
+        page.on("requestfinished", self._ended)
+        page.on("requestfailed", self._ended)
+
+    def _started(self, request) -> None:
+        self._pending.add(request)
+        self._last_change = self._loop.time()
+
+    def _ended(self, request) -> None:
+        self._pending.discard(request)
+        self._last_change = self._loop.time()
+
+    def quiet_for(self, quiet_ms: int) -> bool:
+        return not self._pending and self._loop.time() - self._last_change >= quiet_ms / 1000
+
+
+async def _wait_for_page_ready(
+    page,
+    quiet_ms: int = 400,
+    timeout_ms: int = 3000,
+    network: Optional[_InflightRequests] = None,
+) -> None:
+    # No pending requests plus DOM quiescence, both held for quiet_ms; capped so
+    # pages with long-polling or endless animations still proceed.
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_ms / 1000
+    if network is None:
+        try:
+            await page.wait_for_load_state("networkidle", timeout=timeout_ms)
+        except Exception:
+            pass
+    try:
+        await page.evaluate(_TRACK_DOM_MUTATIONS_JS)
+        while loop.time() < deadline:
+            if (network is None or network.quiet_for(quiet_ms)) and await page.evaluate(
+                _DOM_QUIET_JS, quiet_ms
+            ):
+                return
+            await asyncio.sleep(0.05)
+    except Exception:
+        pass
+
+
+async def _scroll_until_stable(
+    page,
+    max_rounds: int = 30,
+    max_wait_ms: int = 27000,
+    network: Optional[_InflightRequests] = None,
+    stable_rounds: int = 2,
+) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_wait_ms / 1000
+    last_height = await page.evaluate(_PAGE_HEIGHT_JS)
     stable = 0
-    last_height = 0
     for _ in range(max_rounds):
-        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        page.wait_for_timeout(900)
-        height = page.evaluate(
-            "Math.max(document.body.scrollHeight, document.documentElement.scrollHeight)"
-        )
+        remaining_ms = int((deadline - loop.time()) * 1000)
+        if remaining_ms <= 0:
+            break
+        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        await _wait_for_page_ready(page, timeout_ms=min(2500, remaining_ms), network=network)
+        height = await page.evaluate(_PAGE_HEIGHT_JS)
+        # Lazy content has had its chance once the page was idle and did not
+        # grow for several rounds in a row.
         if height <= last_height + 8:
             stable += 1
+            if stable >= stable_rounds:
+                break
         else:
             stable = 0
-        last_height = height
-        if stable >= 3:
-            break
+            last_height = height
 
 
-def _render_text_fallback_pdf(page, url: str, output: Path) -> bool:
-    title = (page.title() or url).strip()
-    body_text = (page.evaluate("document.body.innerText || ''") or "").strip()
+async def _render_text_fallback_pdf(page, url: str, output: Path) -> bool:
+    title = ((await page.title()) or url).strip()
+    body_text = ((await page.evaluate("document.body.innerText || ''")) or "").strip()
     body_text = re.sub(r"\n{3,}", "\n\n", body_text)
     if len(body_text) < 500:
         return False
@@ -822,63 +2143,177 @@ def _render_text_fallback_pdf(page, url: str, output: Path) -> bool:
     </html>
     """
 
-    page.set_content(fallback_html, wait_until="load")
-    page.pdf(
+    await page.set_content(fallback_html, wait_until="load")
+    await page.pdf(
         path=str(output),
         format="A4",
         print_background=True,
         margin={"top": "12mm", "right": "10mm", "bottom": "12mm", "left": "10mm"},
     )
-    return has_pdf_signature(output) and looks_like_text_pdf(output, min_chars=800)
+    return await asyncio.to_thread(_is_text_pdf, output, 800)
+
+
+def _is_text_pdf(path: Path, min_chars: int) -> bool:
+    return has_pdf_signature(path) and looks_like_text_pdf(path, min_chars=min_chars)
+
+
+async def _render_page(page, url: str, output: Path) -> bool:
+    min_chars_for_webpage_pdf = 800
+    network = _InflightRequests(page)
+    for attempt in range(2):
+        await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+        await _wait_for_page_ready(page, timeout_ms=3000 + attempt * 3000, network=network)
+        await _expand_common_read_more(page)
+        await _scroll_until_stable(page, network=network)
+        await page.evaluate("window.scrollTo(0, 0)")
+        await _wait_for_page_ready(page, quiet_ms=200, timeout_ms=1500, network=network)
+        raw_text_len = len(((await page.evaluate("document.body.innerText || ''")) or "").strip())
+        await page.emulate_media(media="screen")
+        await page.pdf(
+            path=str(output),
+            format="A4",
+            print_background=True,
+            prefer_css_page_size=True,
+            margin={"top": "12mm", "right": "10mm", "bottom": "12mm", "left": "10mm"},
+        )
+        # pypdf is CPU-bound; keep it off the loop so other pages keep rendering.
+        if await asyncio.to_thread(_is_text_pdf, output, min_chars_for_webpage_pdf):
+            return True
+        output.unlink(missing_ok=True)
+
+        # Some blogs hide core content in print CSS. Fall back to text-first export.
+        if raw_text_len >= min_chars_for_webpage_pdf and await _render_text_fallback_pdf(
+            page, url, output
+        ):
+            return True
+        output.unlink(missing_ok=True)
+    return False
+
+
+class BrowserPool:
+    """One long-lived Chromium shared by every render job in a run.
+
+    Playwright runs on a dedicated asyncio thread; callers from any worker
+    thread queue a render and wait for it. Up to ``max_contexts`` pages
+    render concurrently, each in its own browser context.
+    """
+
+    def __init__(self, max_contexts: int = 1) -> None:
+        self.max_contexts = max(1, max_contexts)
+        self._playwright = None
+        self._browser = None
+        self._loop = asyncio.new_event_loop()
+        self._launch_lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(self.max_contexts)
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="playwright", daemon=True
+        )
+        self._thread.start()
+
+    def _submit(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def _ensure_browser(self):
+        async with self._launch_lock:
+            if self._browser is None:
+                from playwright.async_api import async_playwright
+
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+        return self._browser
+
+    async def _check(self) -> bool:
+        try:
+            await self._ensure_browser()
+            return True
+        except Exception:
+            await self._shutdown()
+            return False
+
+    def available(self) -> bool:
+        return self._submit(self._check())
+
+    async def _render(self, url: str, output: Path) -> bool:
+        async with self._slots:
+            context = None
+            try:
+                browser = await self._ensure_browser()
+                context = await browser.new_context(viewport={"width": 1600, "height": 2200})
+                return await _render_page(await context.new_page(), url, output)
+            except Exception:
+                output.unlink(missing_ok=True)
+                return False
+            finally:
+                if context is not None:
+                    try:
+                        await context.close()
+                    except Exception:
+                        pass
+
+    def render(self, url: str, output: Path) -> bool:
+        return self._submit(self._render(url, output))
+
+    async def _shutdown(self) -> None:
+        try:
+            if self._browser is not None:
+                await self._browser.close()
+        except Exception:
+            pass
+        try:
+            if self._playwright is not None:
+                await self._playwright.stop()
+        except Exception:
+            pass
+        self._browser = None
+        self._playwright = None
+
+    def close(self) -> None:
+        self._submit(self._shutdown())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+def configure_render_concurrency(max_contexts: int) -> None:
+    global _RENDER_CONCURRENCY
+    _RENDER_CONCURRENCY = max(1, max_contexts)
+
+
+def get_browser_pool() -> BrowserPool:
+    # Probe threads race here via can_render_webpage_to_pdf; a second pool would
+    # leak its loop thread and Chromium.
+    global _BROWSER_POOL
+    with _BROWSER_POOL_LOCK:
+        if _BROWSER_POOL is None:
+            _BROWSER_POOL = BrowserPool(max_contexts=_RENDER_CONCURRENCY)
+        return _BROWSER_POOL
+
+
+def shutdown_browser_pool() -> None:
+    global _BROWSER_POOL, _WEB_RENDER_READY
+    with _BROWSER_POOL_LOCK:
+        pool, _BROWSER_POOL = _BROWSER_POOL, None
+        _WEB_RENDER_READY = None
+    if pool is not None:
+        pool.close()
 
 
 def render_webpage_to_pdf(url: str, output: Path) -> bool:
-    output.parent.mkdir(parents=True, exist_ok=True)
     if not can_render_webpage_to_pdf():
         return False
-    from playwright.sync_api import sync_playwright
-
+    output.parent.mkdir(parents=True, exist_ok=True)
+    # Print into a fresh temp file and only swap it in on success: the current
+    # copy may be a hardlink into the PDF store, and a failed render keeps it.
+    fd, tmp_name = tempfile.mkstemp(prefix=f"{output.name}.", suffix=".render", dir=output.parent)
+    os.close(fd)
+    tmp = Path(tmp_name)
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page(viewport={"width": 1600, "height": 2200})
-            min_chars_for_webpage_pdf = 800
-            for attempt in range(2):
-                page.goto(url, wait_until="domcontentloaded", timeout=60000)
-                page.wait_for_timeout(1800 + attempt * 1400)
-                _expand_common_read_more(page)
-                _scroll_until_stable(page)
-                page.evaluate("window.scrollTo(0, 0)")
-                page.wait_for_timeout(600)
-                raw_text_len = len((page.evaluate("document.body.innerText || ''") or "").strip())
-                page.emulate_media(media="screen")
-                page.pdf(
-                    path=str(output),
-                    format="A4",
-                    print_background=True,
-                    prefer_css_page_size=True,
-                    margin={"top": "12mm", "right": "10mm", "bottom": "12mm", "left": "10mm"},
-                )
-                if has_pdf_signature(output) and looks_like_text_pdf(
-                    output, min_chars=min_chars_for_webpage_pdf
-                ):
-                    browser.close()
-                    return True
-                output.unlink(missing_ok=True)
-
-                # Some blogs hide core content in print CSS. Fall back to text-first export.
-                if raw_text_len >= min_chars_for_webpage_pdf and _render_text_fallback_pdf(
-                    page, url, output
-                ):
-                    browser.close()
-                    return True
-                output.unlink(missing_ok=True)
-            browser.close()
-        return False
-    except Exception:
-        if output.exists():
-            output.unlink(missing_ok=True)
-        return False
+        if not get_browser_pool().render(url, tmp) or not tmp.exists():
+            return False
+        tmp.replace(output)
+        return True
+    finally:
+        tmp.unlink(missing_ok=True)
 
 
 def generate_markdown(records: List[Dict[str, str]]) -> str:
@@ -918,12 +2353,304 @@ def load_models_from_json(models_json_path: Path) -> List[Dict[str, Any]]:
     return models
 
 
+def _fetch_pdf(
+    session: requests.Session,
+    link: str,
+    output: Path,
+    manifest: Optional[DownloadManifest],
+) -> Tuple[str, str]:
+    check = PdfStreamCheck()
+    success, content_type = download_file(session, link, output, manifest=manifest, check=check)
+    if check.rejected == "not_pdf":
+        return "not_pdf", content_type
+    if not success:
+        return "failed", content_type
+    # A 304 revalidation streams nothing, so fall back to the local header.
+    is_pdf = check.signature_ok or (check.size == 0 and has_pdf_signature(output))
+    is_original_pdf = is_pdf and (
+        "pdf" in content_type.lower()
+        or link.lower().endswith(".pdf")
+        or "arxiv.org/pdf/" in link.lower()
+    )
+    if not is_original_pdf:
+        output.unlink(missing_ok=True)
+        return "not_pdf", content_type
+    return "ok", content_type
+
+
+def _render_once(link: str, output: Path, manifest: Optional[DownloadManifest]) -> bool:
+    with host_slot(link):
+        success = render_webpage_to_pdf(link, output)
+    if success:
+        _record_artifact(manifest, link, output, content_type="application/pdf", rendered=True)
+    return success
+
+
+class RecordContext:
+    """Run-wide state every stage of a record reads from."""
+
+    def __init__(
+        self,
+        session: requests.Session,
+        total: int,
+        link_frequency: Dict[str, int],
+        release_month_cache: Dict[str, Tuple[Optional[str], str]],
+        manifest: Optional[DownloadManifest] = None,
+        incremental: bool = False,
+        pdf_store: Optional[PdfStore] = None,
+        shared_fetches: Optional[SharedFetches] = None,
+        arxiv_metadata: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> None:
+        self.session = session
+        self.total = total
+        self.link_frequency = link_frequency
+        self.release_month_cache = release_month_cache
+        self.manifest = manifest
+        self.incremental = incremental
+        self.pdf_store = pdf_store
+        self.shared_fetches = shared_fetches or SharedFetches()
+        self.arxiv_metadata = arxiv_metadata or {}
+
+
+class RecordJob:
+    """One record as it moves through resolve -> fetch -> validate / render."""
+
+    def __init__(self, idx: int, item: Dict[str, Any], selected_link: str, source_reason: str) -> None:
+        self.idx = idx
+        self.record: Dict[str, Any] = dict(item)
+        self.selected_link = selected_link
+        self.source_reason = source_reason
+        self.log: List[str] = []
+        self.outcome = ""
+        self.link = ""
+        self.output = Path()
+        self.mirror = Path()
+        self.source = Path()
+        self.content_type = ""
+        self.arxiv_meta: Optional[Dict[str, Any]] = None
+        self.error: Optional[BaseException] = None
+
+    def finish(self, outcome: str, local_file_path: str, message: str = "") -> None:
+        self.outcome = outcome
+        self.record["local_file_path"] = local_file_path
+        if message:
+            self.log.append(message)
+
+
+def _stage_resolve(ctx: RecordContext, job: RecordJob) -> Optional[str]:
+    record, log = job.record, job.log
+    declared_link = normalize_url(str(record["official_link"]))
+    link = job.link = normalize_url(job.selected_link)
+    record["declared_official_link"] = declared_link
+    record["source_selection_reason"] = job.source_reason
+    if link != declared_link:
+        log.append(f"  URL优选: {declared_link} -> {link} ({job.source_reason})")
+    record["official_link"] = link
+    arxiv_meta = job.arxiv_meta = ctx.arxiv_metadata.get(extract_arxiv_id(link) or "")
+    if arxiv_meta:
+        record["arxiv"] = dict(arxiv_meta)
+    declared_release_date = str(record["release_date"])
+    release_date, release_source = resolve_release_month(
+        session=ctx.session,
+        declared_release_date=declared_release_date,
+        url=link,
+        link_frequency=ctx.link_frequency,
+        cache=ctx.release_month_cache,
+    )
+    if release_date != declared_release_date:
+        log.append(f"  时间前缀校正: {declared_release_date} -> {release_date} ({release_source})")
+    record["release_date"] = release_date
+    year = release_date.split("-")[0]
+    log.insert(0, f"[{job.idx}/{ctx.total}] {record['model']} -> {year}/{record['org_slug']}")
+
+    if record["model"].lower() == "grok 4.5":
+        record["official_link"] = "未发布"
+        job.finish("skip", "未发布")
+        return None
+
+    filename = f"{release_date}_{slugify_model(record['model'])}.pdf"
+    output = job.output = ROOT / year / record["org_slug"] / filename
+    mirror = job.mirror = ROOT / "pdf" / filename
+    manifest, pdf_store = ctx.manifest, ctx.pdf_store
+    entry = manifest.get(link) if manifest is not None else None
+    if is_arxiv_version_stale(entry, arxiv_meta):
+        # Drop the validators so neither the skip below nor a 304 keeps the old version.
+        log.append(f"  arXiv 新版本: v{entry['arxiv_version']} -> v{arxiv_meta['version']}")
+        manifest.update(link, etag=None, last_modified=None)
+    elif ctx.incremental and manifest is not None:
+        digest = str((entry or {}).get("sha256", ""))
+        if not output.exists() and pdf_store is not None and digest and pdf_store.has(digest):
+            pdf_store.materialize(digest, output)
+        if is_local_artifact_current(entry, output):
+            if arxiv_meta:
+                manifest.update(link, arxiv_version=arxiv_meta["version"])
+            if pdf_store is not None:
+                pdf_store.ingest(output, mirror)
+            local = str(output.relative_to(ROOT))
+            job.finish("ok", local, f"  增量跳过: {local} 未变化")
+            return None
+
+    if is_pdf_url(link):
+        return "fetch"
+    if should_render_webpage_to_pdf(link):
+        return "render"
+    job.finish("skip", "仅在线", "  跳过下载: 非 HTTP(s) 资源")
+    return None
+
+
+def _stage_fetch(ctx: RecordContext, job: RecordJob) -> Optional[str]:
+    link, output = job.link, job.output
+    (status, job.content_type), job.source = ctx.shared_fetches.run(
+        link, output, lambda: _fetch_pdf(ctx.session, link, output, ctx.manifest)
+    )
+    if status == "not_pdf":
+        job.finish("fail", "下载失败", f"  下载失败: 非原始 PDF 响应 ({job.content_type})")
+        return None
+    if status != "ok":
+        job.finish("fail", "下载失败", f"  下载失败: {link}")
+        return None
+    if job.source != output:
+        copy_shared_output(job.source, output)
+    if ctx.manifest is not None and job.arxiv_meta:
+        ctx.manifest.update(link, arxiv_version=job.arxiv_meta["version"])
+    if ctx.pdf_store is not None:
+        ctx.pdf_store.ingest(output, job.mirror)
+    return "validate"
+
+
+def _stage_validate(ctx: RecordContext, job: RecordJob) -> Optional[str]:
+    # Measured on the shared source so copies of one link are parsed once.
+    text_len = extract_text_length_from_pdf(job.source)
+    local = str(job.output.relative_to(ROOT))
+    job.finish("ok", local, f"  下载成功: {local} | 原始PDF=是 | 可提取文本={text_len}")
+    return None
+
+
+def _stage_render(ctx: RecordContext, job: RecordJob) -> Optional[str]:
+    link, output = job.link, job.output
+    success, source = ctx.shared_fetches.run(
+        link, output, lambda: _render_once(link, output, ctx.manifest)
+    )
+    if not success:
+        job.finish("fail", "下载失败", f"  网页转 PDF 失败: {link}")
+        return None
+    if source != output:
+        copy_shared_output(source, output)
+    if ctx.pdf_store is not None:
+        ctx.pdf_store.ingest(output, job.mirror)
+    local = str(output.relative_to(ROOT))
+    job.finish("ok", local, f"  网页转 PDF 成功: {local}")
+    return None
+
+
+RECORD_STAGES: Dict[str, Callable[[RecordContext, RecordJob], Optional[str]]] = {
+    "resolve": _stage_resolve,
+    "fetch": _stage_fetch,
+    "validate": _stage_validate,
+    "render": _stage_render,
+}
+
+
+class StagePipeline:
+    """Moves records through stages joined by bounded queues.
+
+    Each stage has its own workers, so a slow render never holds up PDF
+    downloads and pypdf validation overlaps network fetches. Finished jobs
+    are handed to ``on_done`` in ``idx`` order.
+    """
+
+    def __init__(
+        self,
+        ctx: RecordContext,
+        workers: Dict[str, int],
+        queue_size: int = 8,
+    ) -> None:
+        self.ctx = ctx
+        self.workers = {name: max(1, workers.get(name, 1)) for name in RECORD_STAGES}
+        self.queue_size = max(1, queue_size)
+
+    def _advance(self, stage: str, job: RecordJob) -> Optional[str]:
+        try:
+            return RECORD_STAGES[stage](self.ctx, job)
+        except BaseException as e:
+            job.error = e
+            return None
+
+    @staticmethod
+    def _emit_in_order(
+        job: RecordJob, pending: Dict[int, RecordJob], next_idx: List[int], on_done
+    ) -> None:
+        pending[job.idx] = job
+        while next_idx[0] in pending:
+            ready = pending.pop(next_idx[0])
+            if ready.error is not None:
+                raise ready.error
+            on_done(ready)
+            next_idx[0] += 1
+
+    def run(self, jobs: List[RecordJob], on_done: Callable[[RecordJob], None]) -> None:
+        queues = {name: queue.Queue(maxsize=self.queue_size) for name in RECORD_STAGES}
+        done: "queue.Queue[RecordJob]" = queue.Queue()
+
+        def worker(stage: str) -> None:
+            while True:
+                job = queues[stage].get()
+                if job is None:
+                    return
+                nxt = self._advance(stage, job)
+                (queues[nxt] if nxt else done).put(job)
+
+        threads = [
+            threading.Thread(target=worker, args=(name,), daemon=True)
+            for name, count in self.workers.items()
+            for _ in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        feeder = threading.Thread(
+            target=lambda: [queues["resolve"].put(job) for job in jobs], daemon=True
+        )
+        feeder.start()
+        pending: Dict[int, RecordJob] = {}
+        next_idx = [jobs[0].idx if jobs else 0]
+        try:
+            for _ in jobs:
+                self._emit_in_order(done.get(), pending, next_idx, on_done)
+        finally:
+            feeder.join()
+            for name, count in self.workers.items():
+                for _ in range(count):
+                    queues[name].put(None)
+
+
 def main(
     write_readme: bool = False,
     models: Optional[List[Dict[str, Any]]] = None,
     results_json: Optional[Path] = None,
+    jobs: int = 1,
+    per_host: int = DEFAULT_PER_HOST_LIMIT,
+    source_cache: Optional[SourceCache] = None,
+    manifest: Optional[DownloadManifest] = None,
+    incremental: bool = False,
+    pdf_store: Optional[PdfStore] = None,
+    render_concurrency: int = DEFAULT_RENDER_CONCURRENCY,
+    text_cache: Optional[Path] = None,
+    extract_workers: int = 0,
+    http_options: Optional[Dict[str, Any]] = None,
+    html_head_budget: int = WEB_DATE_SCAN_LIMIT,
+    backend: str = "threads",
 ) -> None:
-    session = build_session()
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown backend: {backend}")
+    jobs = max(1, jobs)
+    extract_pool = new_extract_pool(extract_workers) if extract_workers > 0 else None
+    configure_text_cache(text_cache, executor=extract_pool)
+    configure_host_limit(per_host)
+    configure_render_concurrency(render_concurrency)
+    configure_html_head_budget(html_head_budget)
+    session_options = dict(http_options or {})
+    session_options.setdefault("pool_maxsize", max(10, jobs))
+    session = (build_async_session if backend == "async" else build_session)(**session_options)
     results: List[Dict[str, str]] = []
     ok, fail, skip = 0, 0, 0
 
@@ -931,99 +2658,84 @@ def main(
     sorted_models = sorted(active_models, key=lambda x: x["release_date"], reverse=True)
 
     probe_cache: Dict[str, Tuple[bool, str]] = {}
-    selected_links: List[str] = []
-    selected_reasons: List[str] = []
-    for item in sorted_models:
-        selected_link, select_reason = choose_best_source_url(session, item, probe_cache)
-        if not selected_link:
-            selected_link = normalize_url(str(item.get("official_link", "")))
-            select_reason = "single_source_fallback"
-        selected_links.append(selected_link)
-        selected_reasons.append(select_reason)
-
-    normalized_links = [normalize_url(x) for x in selected_links if x]
-    link_frequency = Counter(normalized_links)
     release_month_cache: Dict[str, Tuple[Optional[str], str]] = {}
-
-    for idx, item in enumerate(sorted_models, start=1):
-        record = dict(item)
-        declared_link = normalize_url(str(record["official_link"]))
-        link = normalize_url(selected_links[idx - 1])
-        source_reason = selected_reasons[idx - 1]
-        record["declared_official_link"] = declared_link
-        record["source_selection_reason"] = source_reason
-        if link != declared_link:
-            print(f"  URL优选: {declared_link} -> {link} ({source_reason})", flush=True)
-        record["official_link"] = link
-        declared_release_date = str(record["release_date"])
-        release_date, release_source = resolve_release_month(
-            session=session,
-            declared_release_date=declared_release_date,
-            url=link,
-            link_frequency=link_frequency,
-            cache=release_month_cache,
+    if source_cache is not None:
+        probe_cache, release_month_cache = source_cache.load()
+        configure_probe_methods(source_cache.probe_methods)
+    else:
+        configure_probe_methods()
+    try:
+        prefetch_probe_results(session, sorted_models, probe_cache, jobs=jobs)
+        selected_links: List[str] = []
+        selected_reasons: List[str] = []
+        for item in sorted_models:
+            selected_link, select_reason = choose_best_source_url(session, item, probe_cache)
+            if not selected_link:
+                selected_link = normalize_url(str(item.get("official_link", "")))
+                select_reason = "single_source_fallback"
+            selected_links.append(selected_link)
+            selected_reasons.append(select_reason)
+
+        normalized_links = [normalize_url(x) for x in selected_links if x]
+        link_frequency = Counter(normalized_links)
+        arxiv_metadata: Dict[str, Dict[str, Any]] = {}
+        prefetch_release_months(
+            session, normalized_links, link_frequency, release_month_cache, arxiv_metadata
         )
-        if release_date != declared_release_date:
-            print(
-                f"  时间前缀校正: {declared_release_date} -> {release_date} ({release_source})",
-                flush=True,
-            )
-        record["release_date"] = release_date
-        year = release_date.split("-")[0]
-        print(f"[{idx}/{len(sorted_models)}] {record['model']} -> {year}/{record['org_slug']}", flush=True)
-
-        if record["model"].lower() == "grok 4.5":
-            record["official_link"] = "未发布"
-            record["local_file_path"] = "未发布"
-            skip += 1
-            results.append(record)
-            continue
 
-        filename = f"{release_date}_{slugify_model(record['model'])}.pdf"
-        output = ROOT / year / record["org_slug"] / filename
-
-        if is_pdf_url(link):
-            success, content_type = download_file(session, link, output)
-            if success:
-                is_pdf = has_pdf_signature(output)
-                is_original_pdf = is_pdf and (
-                    "pdf" in content_type.lower()
-                    or link.lower().endswith(".pdf")
-                    or "arxiv.org/pdf/" in link.lower()
-                )
-                text_len = extract_text_length_from_pdf(output)
-                if not is_original_pdf:
-                    output.unlink(missing_ok=True)
-                    record["local_file_path"] = "下载失败"
-                    fail += 1
-                    print(f"  下载失败: 非原始 PDF 响应 ({content_type})", flush=True)
-                else:
-                    record["local_file_path"] = str(output.relative_to(ROOT))
-                    ok += 1
-                    print(
-                        f"  下载成功: {record['local_file_path']} | 原始PDF=是 | 可提取文本={text_len}",
-                        flush=True,
-                    )
-            else:
-                record["local_file_path"] = "下载失败"
-                fail += 1
-                print(f"  下载失败: {link}", flush=True)
-        elif should_render_webpage_to_pdf(link):
-            success = render_webpage_to_pdf(link, output)
-            if success:
-                record["local_file_path"] = str(output.relative_to(ROOT))
+        ctx = RecordContext(
+            session,
+            len(sorted_models),
+            link_frequency,
+            release_month_cache,
+            manifest=manifest,
+            incremental=incremental,
+            pdf_store=pdf_store,
+            arxiv_metadata=arxiv_metadata,
+        )
+        record_jobs = [
+            RecordJob(idx, item, selected_links[idx - 1], selected_reasons[idx - 1])
+            for idx, item in enumerate(sorted_models, start=1)
+        ]
+
+        def collect(job: RecordJob) -> None:
+            nonlocal ok, fail, skip
+            link = job.selected_link
+            job.record["http_retries"] = retry_count(session, normalize_url(link)) if link else 0
+            for line in job.log:
+                print(line, flush=True)
+            if job.outcome == "ok":
                 ok += 1
-                print(f"  网页转 PDF 成功: {record['local_file_path']}", flush=True)
-            else:
-                record["local_file_path"] = "下载失败"
+            elif job.outcome == "fail":
                 fail += 1
-                print(f"  网页转 PDF 失败: {link}", flush=True)
-        else:
-            record["local_file_path"] = "仅在线"
-            skip += 1
-            print("  跳过下载: 非 HTTP(s) 资源", flush=True)
-
-        results.append(record)
+            else:
+                skip += 1
+            results.append(job.record)
+
+        pipeline = StagePipeline(
+            ctx,
+            workers={
+                "resolve": jobs,
+                "fetch": jobs,
+                "validate": extract_workers,
+                "render": render_concurrency,
+            },
+            queue_size=2 * jobs,
+        )
+        pipeline.run(record_jobs, collect)
+    finally:
+        # Close the shared browser and extraction workers even when a record raises.
+        shutdown_browser_pool()
+        if extract_pool is not None:
+            extract_pool.shutdown(wait=True)
+        session.close()
+
+    if source_cache is not None:
+        source_cache.save(
+            probe_cache, release_month_cache, probe_methods=get_probe_methods().snapshot()
+        )
+    if manifest is not None:
+        manifest.save()
 
     if results_json:
         results_json.parent.mkdir(parents=True, exist_ok=True)
@@ -1062,8 +2774,157 @@ if __name__ == "__main__":
         default=ROOT / "scripts" / "latest_download_results.json",
         help="Path to write structured download results for downstream README update",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Workers per network stage (resolve/fetch); validate and render have their own pools (default: 1)",
+    )
+    parser.add_argument(
+        "--per-host",
+        type=int,
+        default=DEFAULT_PER_HOST_LIMIT,
+        help="Maximum concurrent requests against a single host",
+    )
+    parser.add_argument(
+        "--cache-file",
+        type=Path,
+        default=DEFAULT_SOURCE_CACHE,
+        help="JSON-lines cache of probe and release-month results reused across runs",
+    )
+    parser.add_argument(
+        "--probe-ttl-hours",
+        type=float,
+        default=DEFAULT_PROBE_TTL_HOURS,
+        help="Age after which cached webpage probes/dates are re-fetched (arXiv months never expire)",
+    )
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Ignore cached probe/release-month results and re-fetch everything",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        default=DEFAULT_DOWNLOAD_MANIFEST,
+        help="JSON manifest of ETag/Last-Modified validators used to skip unchanged downloads",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse local PDFs whose size, signature and SHA-256 match the manifest",
+    )
+    parser.add_argument(
+        "--pdf-store",
+        type=Path,
+        default=DEFAULT_PDF_STORE,
+        help="Content-addressed PDF store backing the year/org tree and the flat pdf/ mirror",
+    )
+    parser.add_argument(
+        "--link-mode",
+        choices=PdfStore.LINK_MODES,
+        default="hardlink",
+        help=(
+            "How archive paths are materialized from the PDF store. hardlink and copy "
+            "leave regular files; symlink points tracked 2025/... and pdf/... files into "
+            "the gitignored store, so they dangle in other clones (local use only)"
+        ),
+    )
+    parser.add_argument(
+        "--no-pdf-store",
+        action="store_true",
+        help="Write plain files without the content-addressed store or pdf/ mirror",
+    )
+    parser.add_argument(
+        "--render-concurrency",
+        type=int,
+        default=DEFAULT_RENDER_CONCURRENCY,
+        help="Maximum webpages rendered at once (separate contexts of one browser)",
+    )
+    parser.add_argument(
+        "--text-cache",
+        type=Path,
+        default=DEFAULT_TEXT_CACHE,
+        help="Directory where extracted PDF page text is persisted by SHA-256",
+    )
+    parser.add_argument(
+        "--extract-workers",
+        type=int,
+        default=0,
+        help="Processes used for pypdf text extraction (default: 0, inline)",
+    )
+    parser.add_argument(
+        "--pool-connections",
+        type=int,
+        default=10,
+        help="Number of per-host connection pools kept alive",
+    )
+    parser.add_argument(
+        "--pool-maxsize",
+        type=int,
+        help="Maximum kept-alive connections per host (default: max(10, --jobs))",
+    )
+    parser.add_argument("--connect-timeout", type=float, default=DEFAULT_CONNECT_TIMEOUT)
+    parser.add_argument("--read-timeout", type=float, default=DEFAULT_READ_TIMEOUT)
+    parser.add_argument("--retries", type=int, default=1, help="Retries per request")
+    parser.add_argument(
+        "--backoff",
+        type=float,
+        default=0.5,
+        help="Exponential backoff factor between retries (seconds)",
+    )
+    parser.add_argument(
+        "--max-retry-after",
+        type=float,
+        default=CappedRetry.DEFAULT_MAX_RETRY_AFTER,
+        help="Upper bound (seconds) on honoring a server's Retry-After header",
+    )
+    parser.add_argument(
+        "--html-head-budget",
+        type=int,
+        default=WEB_DATE_SCAN_LIMIT,
+        help="Max bytes read from an HTML page shared by probing and date inference",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="threads",
+        help="HTTP client: requests per worker thread, or one httpx event loop (HTTP/2 with h2)",
+    )
     args = parser.parse_args()
+    if args.backend == "async" and httpx is None:
+        parser.error("--backend async needs httpx (pip install 'httpx[http2]')")
     runtime_models = None
+    http_options: Dict[str, Any] = {
+        "pool_connections": args.pool_connections,
+        "connect_timeout": args.connect_timeout,
+        "read_timeout": args.read_timeout,
+        "retries": args.retries,
+        "backoff_factor": args.backoff,
+        "max_retry_after": args.max_retry_after,
+    }
+    if args.pool_maxsize:
+        http_options["pool_maxsize"] = args.pool_maxsize
     if args.models_json:
         runtime_models = load_models_from_json(args.models_json)
-    main(write_readme=args.write_readme, models=runtime_models, results_json=args.results_json)
+    main(
+        write_readme=args.write_readme,
+        models=runtime_models,
+        results_json=args.results_json,
+        jobs=args.jobs,
+        per_host=args.per_host,
+        source_cache=SourceCache(
+            args.cache_file,
+            probe_ttl_seconds=args.probe_ttl_hours * 3600,
+            refresh=args.refresh_cache,
+        ),
+        manifest=DownloadManifest(args.manifest),
+        incremental=args.incremental,
+        pdf_store=None if args.no_pdf_store else PdfStore(args.pdf_store, link_mode=args.link_mode),
+        render_concurrency=args.render_concurrency,
+        text_cache=args.text_cache,
+        extract_workers=args.extract_workers,
+        http_options=http_options,
+        html_head_budget=args.html_head_budget,
+        backend=args.backend,
+    )
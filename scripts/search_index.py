@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Incremental SQLite FTS5 full-text index over archived technical report PDFs."""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import download_papers
+from scripts.update_readme_incremental import DEFAULT_README, parse_existing_rows, row_key
+
+DEFAULT_INDEX = ROOT / ".search_index.sqlite3"
+MAX_INDEX_PAGES = 10_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    release_date TEXT NOT NULL,
+    model_key TEXT NOT NULL,
+    model TEXT NOT NULL,
+    organization TEXT NOT NULL,
+    org_slug TEXT NOT NULL,
+    path TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    PRIMARY KEY (release_date, model_key)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS pages USING fts5(
+    body,
+    release_date UNINDEXED,
+    model_key UNINDEXED,
+    page UNINDEXED,
+    tokenize = 'unicode61'
+);
+"""
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(db_path))
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def org_slug_from_path(local_file: str) -> str:
+    parts = Path(local_file).parts
+    return parts[1] if len(parts) >= 3 else ""
+
+
+def indexable_rows(rows: List[Dict[str, str]], root: Path) -> List[Dict[str, str]]:
+    out: List[Dict[str, str]] = []
+    for row in rows:
+        local_file = row.get("local_file", "")
+        if not local_file.endswith(".pdf") or not (root / local_file).exists():
+            continue
+        out.append(row)
+    return out
+
+
+def build_index(
+    conn: sqlite3.Connection,
+    rows: List[Dict[str, str]],
+    root: Path,
+    extractor: Optional[download_papers.TextExtractor] = None,
+) -> Dict[str, int]:
+    """Index README rows with a local PDF; only rows whose PDF hash changed are re-read."""
+    extractor = extractor or download_papers.TextExtractor(download_papers.DEFAULT_TEXT_CACHE)
+    existing = {
+        (r["release_date"], r["model_key"]): r["sha256"]
+        for r in conn.execute("SELECT release_date, model_key, sha256 FROM docs")
+    }
+    stats = {"indexed": 0, "unchanged": 0, "removed": 0}
+    seen = set()
+    for row in indexable_rows(rows, root):
+        key = row_key(row)
+        seen.add(key)
+        path = root / row["local_file"]
+        digest = download_papers.file_sha256(path)
+        if existing.get(key) == digest:
+            stats["unchanged"] += 1
+            continue
+        pages = extractor.pages(path, max_pages=MAX_INDEX_PAGES)
+        with conn:
+            conn.execute("DELETE FROM pages WHERE release_date = ? AND model_key = ?", key)
+            conn.execute(
+                "INSERT OR REPLACE INTO docs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key[0],
+                    key[1],
+                    row["model"],
+                    row["organization"],
+                    org_slug_from_path(row["local_file"]),
+                    row["local_file"],
+                    digest,
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO pages (body, release_date, model_key, page) VALUES (?, ?, ?, ?)",
+                [(text, key[0], key[1], i + 1) for i, text in enumerate(pages) if text],
+            )
+        stats["indexed"] += 1
+
+    for key in set(existing) - seen:
+        with conn:
+            conn.execute("DELETE FROM pages WHERE release_date = ? AND model_key = ?", key)
+            conn.execute("DELETE FROM docs WHERE release_date = ? AND model_key = ?", key)
+        stats["removed"] += 1
+    return stats
+
+
+def quote_query(text: str) -> str:
+    # Each whitespace-separated term becomes an FTS5 string, so "GPT-5" or
+    # "Qwen3.5" match literally instead of parsing as column filters/operators.
+    return " ".join('"' + term.replace('"', '""') + '"' for term in text.split())
+
+
+def search(
+    conn: sqlite3.Connection,
+    query: str,
+    org: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    limit: int = 20,
+    raw: bool = False,
+) -> List[Dict[str, object]]:
+    """Rank pages matching ``query``; ``raw`` passes it through as FTS5 syntax."""
+    if not raw:
+        query = quote_query(query)
+        if not query:
+            return []
+    sql = [
+        "SELECT d.release_date, d.model, d.organization, d.path, p.page,",
+        "snippet(pages, 0, '[', ']', ' ... ', 12) AS snippet",
+        "FROM pages p JOIN docs d",
+        "ON d.release_date = p.release_date AND d.model_key = p.model_key",
+        "WHERE pages MATCH ?",
+    ]
+    params: List[object] = [query]
+    if org:
+        sql.append("AND (lower(d.organization) = lower(?) OR d.org_slug = lower(?))")
+        params.extend([org, org])
+    if date_from:
+        sql.append("AND d.release_date >= ?")
+        params.append(date_from)
+    if date_to:
+        sql.append("AND d.release_date <= ?")
+        params.append(date_to)
+    sql.append("ORDER BY bm25(pages) LIMIT ?")
+    params.append(limit)
+    return [dict(r) for r in conn.execute(" ".join(sql), params)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Full-text search over archived technical reports")
+    parser.add_argument("--index", type=Path, default=DEFAULT_INDEX)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="Incrementally (re)index PDFs listed in README")
+    build.add_argument("--readme", type=Path, default=DEFAULT_README)
+
+    query = sub.add_parser("query", help="Search the index")
+    query.add_argument("text", help="Search terms, e.g. 'GPT-5 mixture of experts'")
+    query.add_argument(
+        "--raw",
+        action="store_true",
+        help="Treat text as FTS5 query syntax, e.g. 'mixture AND expert*'",
+    )
+    query.add_argument("--org", help="Organization display name or org slug")
+    query.add_argument("--from", dest="date_from", help="Earliest release month (YYYY-MM)")
+    query.add_argument("--to", dest="date_to", help="Latest release month (YYYY-MM)")
+    query.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    conn = connect(args.index)
+    if args.command == "build":
+        rows = parse_existing_rows(args.readme.read_text(encoding="utf-8"))
+        stats = build_index(conn, rows, ROOT)
+        print(f"indexed={stats['indexed']} unchanged={stats['unchanged']} removed={stats['removed']}")
+        return
+
+    try:
+        hits = search(conn, args.text, args.org, args.date_from, args.date_to, args.limit, args.raw)
+    except sqlite3.OperationalError as e:
+        parser.error(f"invalid FTS5 query {args.text!r}: {e}")
+    for hit in hits:
+        print(
+            f"{hit['release_date']} | {hit['organization']} | {hit['model']} "
+            f"| p.{hit['page']} | {hit['path']}"
+        )
+        print(f"    {hit['snippet']}")
+
+
+if __name__ == "__main__":
+    main()
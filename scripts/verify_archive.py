@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Offline health check for the local PDF archive (year/org tree and pdf/ mirror)."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import download_papers
+
+MIN_TEXT_CHARS = 200
+
+
+def collect_archive_pdfs(root: Path) -> List[Path]:
+    paths: List[Path] = []
+    for year_dir in sorted(root.iterdir()):
+        if year_dir.is_dir() and re.match(r"^20\d{2}$", year_dir.name):
+            paths.extend(sorted(year_dir.glob("*/*.pdf")))
+    mirror = root / "pdf"
+    if mirror.is_dir():
+        paths.extend(sorted(mirror.glob("*.pdf")))
+    return paths
+
+
+def manifest_hashes(manifest_path: Path) -> Dict[str, str]:
+    manifest = download_papers.DownloadManifest(manifest_path)
+    out: Dict[str, str] = {}
+    for entry in manifest.entries.values():
+        if entry.get("path") and entry.get("sha256"):
+            out[str(entry["path"])] = str(entry["sha256"])
+    return out
+
+
+def inspect_pdf(path: Path, root: Path) -> Dict[str, object]:
+    return {
+        "path": path.relative_to(root).as_posix(),
+        "size": path.stat().st_size,
+        "sha256": download_papers.file_sha256(path),
+        "signature": download_papers.has_pdf_signature(path),
+        "trailer": download_papers.has_pdf_trailer(path),
+        "text_chars": 0,
+        "issues": [],
+        "warnings": [],
+    }
+
+
+def verify_archive(
+    root: Path,
+    manifest_path: Optional[Path] = None,
+    workers: int = 4,
+    min_text_chars: int = MIN_TEXT_CHARS,
+    strict_text: bool = False,
+) -> Dict[str, object]:
+    paths = collect_archive_pdfs(root)
+    workers = max(1, workers)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        files = list(pool.map(lambda p: inspect_pdf(p, root), paths))
+
+    # Mirrored and shared PDFs have identical bytes; parse each digest once.
+    first_by_digest: Dict[str, Path] = {}
+    for path, f in zip(paths, files):
+        first_by_digest.setdefault(str(f["sha256"]), path)
+    with download_papers.new_extract_pool(workers) as extract_pool:
+        extractor = download_papers.TextExtractor(executor=extract_pool)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            digests = list(first_by_digest)
+            lengths = pool.map(
+                lambda d: extractor.text_length(first_by_digest[d], min_chars=min_text_chars),
+                digests,
+            )
+            text_chars = dict(zip(digests, lengths))
+
+    for f in files:
+        f["text_chars"] = text_chars[str(f["sha256"])]
+        issues: List[str] = f["issues"]  # type: ignore[assignment]
+        if not f["signature"]:
+            issues.append("bad_signature")
+        if not f["trailer"]:
+            issues.append("missing_eof_trailer")
+        # Downloaded originals may legitimately be image-heavy; only strict mode fails them.
+        if int(f["text_chars"]) < min_text_chars:  # type: ignore[arg-type]
+            target = issues if strict_text else f["warnings"]
+            target.append("low_extractable_text")  # type: ignore[union-attr]
+
+    by_path = {str(f["path"]): f for f in files}
+    expected = manifest_hashes(manifest_path) if manifest_path and manifest_path.exists() else {}
+    for rel, digest in sorted(expected.items()):
+        current = by_path.get(rel)
+        if current is None:
+            continue
+        if current["sha256"] != digest:
+            current["issues"].append("manifest_hash_mismatch")  # type: ignore[union-attr]
+
+    # The flat pdf/ mirror must hold the same bytes as the year/org tree.
+    tree_hashes = {Path(p).name: f["sha256"] for p, f in by_path.items() if not p.startswith("pdf/")}
+    for rel, current in by_path.items():
+        if not rel.startswith("pdf/"):
+            continue
+        name = Path(rel).name
+        if name in tree_hashes and tree_hashes[name] != current["sha256"]:
+            current["issues"].append("mirror_hash_mismatch")  # type: ignore[union-attr]
+
+    problems = [f for f in files if f["issues"]]
+    warned = [f for f in files if f["warnings"]]
+    return {
+        "summary": {
+            "files": len(files),
+            "ok": len(files) - len(problems),
+            "problems": len(problems),
+            "warnings": len(warned),
+        },
+        "files": files,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Verify local PDF archive without touching the network")
+    parser.add_argument("--root", type=Path, default=ROOT)
+    parser.add_argument("--manifest", type=Path, default=download_papers.DEFAULT_DOWNLOAD_MANIFEST)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--min-text-chars", type=int, default=MIN_TEXT_CHARS)
+    parser.add_argument(
+        "--strict-text",
+        action="store_true",
+        help="Treat PDFs below --min-text-chars as problems instead of warnings",
+    )
+    parser.add_argument("--report", type=Path, help="Optional path for the JSON report (default: stdout)")
+    args = parser.parse_args()
+
+    report = verify_archive(
+        args.root,
+        manifest_path=args.manifest,
+        workers=args.workers,
+        min_text_chars=args.min_text_chars,
+        strict_text=args.strict_text,
+    )
+    payload = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.report:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        args.report.write_text(payload + "\n", encoding="utf-8")
+        summary = report["summary"]
+        print(
+            f"files={summary['files']} ok={summary['ok']} "
+            f"problems={summary['problems']} warnings={summary['warnings']}"
+        )
+    else:
+        print(payload)
+    return 1 if report["summary"]["problems"] else 0  # type: ignore[index]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,8 +1,15 @@
+import asyncio
+import io
+import http.server
+import threading
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import patch
 import json
+import os
 
 try:
     from llm_papers import download_papers
@@ -10,6 +17,136 @@ except ModuleNotFoundError:  # pragma: no cover - local fallback
     import download_papers
 
 
+def build_text_pdf(page_texts) -> bytes:
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for text in page_texts:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>"
+            % content_id
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % k for k in kids),
+        len(kids),
+    )
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for i, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % i + obj + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % o for o in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return out
+
+
+class FlakyHandler(http.server.BaseHTTPRequestHandler):
+    hits = 0
+
+    def do_GET(self) -> None:
+        FlakyHandler.hits += 1
+        if FlakyHandler.hits == 1:
+            self.send_response(503)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        return None
+
+
+class ArchiveHandler(http.server.BaseHTTPRequestHandler):
+    pdf = build_text_pdf(["Technical report " * 20])
+
+    def _send(self, with_body: bool) -> None:
+        if not self.path.endswith("/report.pdf"):
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/pdf")
+        self.send_header("Content-Length", str(len(self.pdf)))
+        self.end_headers()
+        if with_body:
+            self.wfile.write(self.pdf)
+
+    def do_HEAD(self) -> None:
+        self._send(with_body=False)
+
+    def do_GET(self) -> None:
+        self._send(with_body=True)
+
+    def log_message(self, *args) -> None:
+        return None
+
+
+class FakeResponse:
+    def __init__(self, status_code: int = 200, body: bytes = b"", headers=None) -> None:
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+        self.raw = io.BytesIO(body)
+        self.encoding = "utf-8"
+        self.chunks_read = 0
+
+    def __enter__(self) -> "FakeResponse":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+    @property
+    def content(self) -> bytes:
+        return self.body
+
+    @property
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise download_papers.requests.HTTPError(f"http_{self.status_code}", response=self)
+
+    def iter_content(self, chunk_size: int = 8192):
+        for i in range(0, len(self.body), chunk_size):
+            self.chunks_read += 1
+            yield self.body[i : i + chunk_size]
+
+
+class FakeSession:
+    def __init__(self, handler) -> None:
+        self.handler = handler
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return self.handler(url, kwargs)
+
+    def head(self, url, **kwargs):
+        self.calls.append((url, dict(kwargs, method="HEAD")))
+        return self.handler(url, dict(kwargs, method="HEAD"))
+
+
 class DownloadPapersTests(unittest.TestCase):
     def test_should_render_webpage_to_pdf_for_blog_links(self) -> None:
         self.assertTrue(
@@ -41,6 +178,24 @@ class DownloadPapersTests(unittest.TestCase):
             path.write_bytes(b"not-a-pdf")
             self.assertFalse(download_papers.has_pdf_signature(path))
 
+    def test_pdf_view_helpers_check_header_and_trailer_only(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            empty = Path(tmpdir) / "empty.pdf"
+            empty.write_bytes(b"")
+            self.assertFalse(download_papers.has_pdf_signature(empty))
+            self.assertFalse(download_papers.has_pdf_trailer(empty))
+            self.assertEqual(download_papers.extract_text_length_from_pdf(empty), 0)
+
+            early_eof = Path(tmpdir) / "early.pdf"
+            early_eof.write_bytes(b"%PDF-1.7\n%%EOF\n" + b"x" * 4096)
+            self.assertTrue(download_papers.has_pdf_signature(early_eof))
+            self.assertFalse(download_papers.has_pdf_trailer(early_eof))
+
+            report = Path(tmpdir) / "report.pdf"
+            report.write_bytes(build_text_pdf(["hello mapped world"]))
+            self.assertTrue(download_papers.has_pdf_trailer(report))
+            self.assertEqual(download_papers.extract_text_length_from_pdf(report), 18)
+
     def test_extract_text_length_from_pdf_returns_zero_for_missing_file(self) -> None:
         with TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "missing.pdf"
@@ -111,6 +266,796 @@ class DownloadPapersTests(unittest.TestCase):
         self.assertEqual(url, "https://arxiv.org/pdf/2505.09388")
         self.assertIn("probe_ok", reason)
 
+    def test_prefetch_probe_results_dedupes_and_matches_serial_choice(self) -> None:
+        records = [
+            {
+                "official_link": "https://qwen.ai/blog?id=qwen3.5",
+                "candidate_links": ["https://arxiv.org/abs/2505.09388"],
+            },
+            {
+                "official_link": "https://arxiv.org/pdf/2505.09388",
+                "candidate_links": ["https://cdn.openai.com/pdf/x.pdf"],
+            },
+        ]
+        verdicts = {
+            "https://arxiv.org/pdf/2505.09388": (True, "pdf_content_type"),
+            "https://qwen.ai/blog?id=qwen3.5": (True, "html_renderable"),
+            "https://cdn.openai.com/pdf/x.pdf": (False, "http_404"),
+        }
+        probe_cache = {}
+        with patch.object(
+            download_papers, "probe_source_url", side_effect=lambda s, u: verdicts[u]
+        ) as probe:
+            download_papers.prefetch_probe_results(None, records, probe_cache, jobs=3)
+            chosen = [
+                download_papers.choose_best_source_url(None, r, probe_cache) for r in records
+            ]
+        self.assertEqual(probe.call_count, 3)
+        self.assertEqual(probe_cache, verdicts)
+        self.assertEqual(chosen[0][0], "https://arxiv.org/pdf/2505.09388")
+        self.assertEqual(chosen[1][0], "https://arxiv.org/pdf/2505.09388")
+
+    def test_source_cache_keeps_arxiv_months_and_expires_webpage_entries(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "cache.jsonl"
+            cache = download_papers.SourceCache(path, probe_ttl_seconds=3600)
+            cache.save(
+                {
+                    "https://qwen.ai/blog?id=qwen3.5": (True, "html_renderable"),
+                    "https://example.com/a.pdf": (False, "probe_error:ConnectTimeout"),
+                    "https://example.com/b.pdf": (False, "http_503"),
+                    "https://example.com/c.pdf": (False, "http_429"),
+                    "https://example.com/d.pdf": (False, "http_404"),
+                    "https://qwen.ai/blog?id=qwen3": (False, "renderer_unavailable"),
+                },
+                {
+                    "https://arxiv.org/pdf/2505.09388": ("2025-05", "arxiv_published"),
+                    "https://qwen.ai/blog?id=qwen3.5": ("2026-02", "webpage_published"),
+                },
+                now=1000.0,
+            )
+            fresh = download_papers.SourceCache(path, probe_ttl_seconds=3600)
+            probes, months = fresh.load(now=2000.0)
+            self.assertEqual(
+                probes,
+                {
+                    "https://qwen.ai/blog?id=qwen3.5": (True, "html_renderable"),
+                    "https://example.com/d.pdf": (False, "http_404"),
+                },
+            )
+            self.assertEqual(len(months), 2)
+
+            probes, months = download_papers.SourceCache(path, 3600).load(now=1000.0 + 7200)
+            self.assertEqual(probes, {})
+            self.assertEqual(
+                months, {"https://arxiv.org/pdf/2505.09388": ("2025-05", "arxiv_published")}
+            )
+
+            probes, months = download_papers.SourceCache(path, 3600, refresh=True).load(now=2000.0)
+            self.assertEqual((probes, months), ({}, {}))
+
+    def test_pdf_probe_prefers_head_and_remembers_range_hosts(self) -> None:
+        def handler(url, kwargs):
+            if "missing" in url:
+                return FakeResponse(404)
+            if "login" in url:
+                if kwargs.get("method") == "HEAD":
+                    return FakeResponse(200, headers={"Content-Type": "text/html"})
+                return FakeResponse(200, b"<html>Sign in</html>", {"Content-Type": "text/html"})
+            if kwargs.get("method") == "HEAD":
+                if "cdn.example.com" in url:
+                    return FakeResponse(405)
+                return FakeResponse(200, headers={"Content-Type": "application/pdf"})
+            self.assertEqual(kwargs["headers"], {"Range": "bytes=0-1023"})
+            return FakeResponse(206, b"%PDF-1.7\n" + b"x" * 1014, {"Content-Type": "binary/octet-stream"})
+
+        download_papers.configure_probe_methods()
+        session = FakeSession(handler)
+        probe = download_papers.probe_source_url
+        self.assertEqual(probe(session, "https://cdn.openai.com/missing.pdf"), (False, "http_404"))
+        self.assertEqual(
+            probe(session, "https://cdn.openai.com/login/a.pdf"), (False, "not_pdf:text/html")
+        )
+        self.assertEqual(download_papers.get_probe_methods().snapshot(), {})
+        session.calls.clear()
+        self.assertEqual(probe(session, "https://arxiv.org/pdf/2505.09388"), (True, "pdf_content_type"))
+        self.assertEqual(probe(session, "https://cdn.example.com/a.pdf"), (True, "pdf_signature"))
+        self.assertEqual(probe(session, "https://cdn.example.com/b.pdf"), (True, "pdf_signature"))
+        methods = [kwargs.get("method", "GET") for _, kwargs in session.calls]
+        self.assertEqual(methods, ["HEAD", "HEAD", "GET", "GET"])
+        self.assertEqual(
+            download_papers.get_probe_methods().snapshot(),
+            {"arxiv.org": "head", "cdn.example.com": "range"},
+        )
+
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "cache.jsonl"
+            download_papers.SourceCache(path, 3600).save(
+                {}, {}, now=1000.0, probe_methods=download_papers.get_probe_methods().snapshot()
+            )
+            fresh = download_papers.SourceCache(path, 3600)
+            fresh.load(now=2000.0)
+            self.assertEqual(fresh.probe_methods, {"arxiv.org": "head", "cdn.example.com": "range"})
+
+    def test_download_file_revalidates_with_stored_etag(self) -> None:
+        body = b"%PDF-1.7\n" + b"x" * 100 + b"\n%%EOF\n"
+
+        def handler(url, kwargs):
+            if kwargs.get("headers", {}).get("If-None-Match") == '"v1"':
+                return FakeResponse(304)
+            return FakeResponse(
+                200,
+                body,
+                {"Content-Type": "application/pdf", "ETag": '"v1"', "Last-Modified": "Mon"},
+            )
+
+        with TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "2025" / "org" / "a.pdf"
+            manifest = download_papers.DownloadManifest(Path(tmpdir) / "manifest.json")
+            session = FakeSession(handler)
+            url = "https://arxiv.org/pdf/2505.09388"
+            self.assertEqual(
+                download_papers.download_file(session, url, output, manifest=manifest),
+                (True, "application/pdf"),
+            )
+            manifest.save()
+            reloaded = download_papers.DownloadManifest(Path(tmpdir) / "manifest.json")
+            self.assertEqual(
+                download_papers.download_file(session, url, output, manifest=reloaded),
+                (True, "application/pdf"),
+            )
+            self.assertEqual(session.calls[0][1]["headers"], {})
+            self.assertEqual(
+                session.calls[1][1]["headers"],
+                {"If-None-Match": '"v1"', "If-Modified-Since": "Mon"},
+            )
+            self.assertEqual(output.read_bytes(), body)
+
+    def test_download_file_resumes_partial_transfer_with_range(self) -> None:
+        body = b"%PDF-1.7\n" + bytes(range(256)) * 40 + b"\n%%EOF\n"
+
+        class BrokenResponse(FakeResponse):
+            def iter_content(self, chunk_size: int = 8192):
+                yield self.body[:4096]
+                raise download_papers.requests.ConnectionError("reset")
+
+        def handler(url, kwargs):
+            range_header = kwargs.get("headers", {}).get("Range")
+            if range_header:
+                start = int(range_header[len("bytes=") : -1])
+                return FakeResponse(
+                    206,
+                    body[start:],
+                    {"Content-Type": "application/pdf", "Content-Range": f"bytes {start}-"},
+                )
+            return BrokenResponse(200, body, {"Content-Type": "application/pdf", "ETag": '"v1"'})
+
+        with TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "a.pdf"
+            session = FakeSession(handler)
+            url = "https://cdn.openai.com/pdf/a.pdf"
+            self.assertEqual(download_papers.download_file(session, url, output), (False, ""))
+            part = download_papers.partial_download_path(output)
+            self.assertFalse(output.exists())
+            self.assertEqual(part.stat().st_size, 4096)
+
+            self.assertEqual(
+                download_papers.download_file(session, url, output), (True, "application/pdf")
+            )
+            self.assertEqual(
+                session.calls[1][1]["headers"], {"Range": "bytes=4096-", "If-Range": '"v1"'}
+            )
+            self.assertEqual(output.read_bytes(), body)
+            self.assertFalse(part.exists())
+            self.assertFalse(download_papers.partial_validators_path(output).exists())
+
+    def test_download_file_restarts_when_remote_changed_since_partial(self) -> None:
+        old = b"%PDF-1.7\nversion one " + b"a" * 5000 + b"\n%%EOF\n"
+        new = b"%PDF-1.7\nversion two " + b"b" * 7000 + b"\n%%EOF\n"
+
+        def handler(url, kwargs):
+            headers = kwargs.get("headers", {})
+            if "Range" in headers:
+                # If-Range no longer matches, so the server sends the full new file.
+                self.assertEqual(headers["If-Range"], '"v1"')
+                return FakeResponse(200, new, {"Content-Type": "application/pdf", "ETag": '"v2"'})
+            return FakeResponse(503)
+
+        with TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "a.pdf"
+            part = download_papers.partial_download_path(output)
+            part.write_bytes(old[:4096])
+            download_papers.partial_validators_path(output).write_text(
+                json.dumps({"etag": '"v1"', "last_modified": None}), encoding="utf-8"
+            )
+            url = "https://arxiv.org/pdf/2602.15763"
+            self.assertTrue(download_papers.download_file(FakeSession(handler), url, output)[0])
+            self.assertEqual(output.read_bytes(), new)
+
+            # Without stored validators the part cannot be trusted, so no Range is sent.
+            part.write_bytes(old[:4096])
+            session = FakeSession(lambda url, kwargs: FakeResponse(503))
+            self.assertEqual(download_papers.download_file(session, url, output), (False, ""))
+            self.assertNotIn("Range", session.calls[0][1]["headers"])
+            # A 5xx keeps the partial for the next run; a 4xx drops it.
+            self.assertTrue(part.exists())
+            session = FakeSession(lambda url, kwargs: FakeResponse(404))
+            self.assertEqual(download_papers.download_file(session, url, output), (False, ""))
+            self.assertFalse(part.exists())
+
+    def test_download_file_retries_without_range_after_416(self) -> None:
+        body = b"%PDF-1.7\n" + b"x" * 3000 + b"\n%%EOF\n"
+
+        def handler(url, kwargs):
+            if "Range" in kwargs.get("headers", {}):
+                return FakeResponse(416)
+            return FakeResponse(200, body, {"Content-Type": "application/pdf", "ETag": '"v1"'})
+
+        with TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "a.pdf"
+            # A crash between the last write and the rename leaves a complete part.
+            download_papers.partial_download_path(output).write_bytes(body)
+            download_papers.partial_validators_path(output).write_text(
+                json.dumps({"etag": '"v1"', "last_modified": None}), encoding="utf-8"
+            )
+            session = FakeSession(handler)
+            self.assertEqual(
+                download_papers.download_file(session, "https://example.com/a.pdf", output),
+                (True, "application/pdf"),
+            )
+            self.assertEqual(len(session.calls), 2)
+            self.assertEqual(session.calls[1][1]["headers"], {})
+            self.assertEqual(output.read_bytes(), body)
+
+    def test_download_file_rejects_html_after_first_chunk(self) -> None:
+        class HtmlResponse(FakeResponse):
+            chunks_read = 0
+
+            def iter_content(self, chunk_size: int = 8192):
+                for _ in range(1000):
+                    HtmlResponse.chunks_read += 1
+                    yield b"<!doctype html><title>Sign in</title>"
+
+        with TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "a.pdf"
+            check = download_papers.PdfStreamCheck()
+            session = FakeSession(
+                lambda url, kwargs: HtmlResponse(200, headers={"Content-Type": "text/html"})
+            )
+            ok, content_type = download_papers.download_file(
+                session, "https://example.com/a.pdf", output, check=check
+            )
+            self.assertFalse(ok)
+            self.assertEqual(content_type, "text/html")
+            self.assertEqual(check.rejected, "not_pdf")
+            self.assertEqual(HtmlResponse.chunks_read, 1)
+            self.assertFalse(output.exists())
+            self.assertFalse(download_papers.partial_download_path(output).exists())
+
+    def test_pdf_stream_check_requires_eof_trailer(self) -> None:
+        check = download_papers.PdfStreamCheck()
+        for chunk in (b"%PD", b"F-1.7\n", b"x" * 5000):
+            self.assertTrue(check.feed(chunk))
+        self.assertFalse(check.finish())
+        self.assertEqual(check.rejected, "truncated")
+        self.assertEqual(check.size, 5009)
+
+    def test_text_extractor_stops_at_budget_and_persists_pages(self) -> None:
+        page_texts = [f"page{i} " + "lorem ipsum " * 40 for i in range(5)]
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "report.pdf"
+            path.write_bytes(build_text_pdf(page_texts))
+            cache_dir = Path(tmpdir) / "text"
+            extractor = download_papers.TextExtractor(cache_dir)
+            self.assertEqual(len(extractor.pages(path, min_chars=800)), 2)
+            self.assertEqual(len(next(iter(extractor._memo.values()))[0]), 2)
+            full = extractor.text_length(path)
+            self.assertEqual(full, sum(len(t.strip()) for t in page_texts))
+
+            with patch.object(download_papers, "PdfReader", side_effect=AssertionError("reparsed")):
+                reloaded = download_papers.TextExtractor(cache_dir)
+                self.assertEqual(reloaded.text_length(path), full)
+
+    def test_text_extractor_process_pool_matches_inline(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            paths = []
+            for i in range(3):
+                path = Path(tmpdir) / f"{i}.pdf"
+                path.write_bytes(build_text_pdf([f"doc{i} page{j} " * 10 for j in range(3)]))
+                paths.append(path)
+            inline = [download_papers.TextExtractor().text_length(p) for p in paths]
+            with download_papers.new_extract_pool(2) as pool:
+                extractor = download_papers.TextExtractor(executor=pool)
+                with ThreadPoolExecutor(max_workers=3) as threads:
+                    pooled = list(threads.map(extractor.text_length, paths))
+        self.assertEqual(pooled, inline)
+        self.assertTrue(all(n > 0 for n in inline))
+
+    def test_pdf_store_dedupes_identical_files_into_one_blob(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            store = download_papers.PdfStore(root / ".pdf_store")
+            a = root / "2025" / "deepseek" / "2025-01_deepseek-v3.pdf"
+            b = root / "2025" / "deepseek" / "2025-09_deepseek-v3.1-terminus.pdf"
+            mirror = root / "pdf" / a.name
+            for path in (a, b):
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(b"%PDF-1.7\nsame")
+            digest_a = store.ingest(a, mirror)
+            digest_b = store.ingest(b)
+            self.assertEqual(digest_a, digest_b)
+            blob = store.blob_path(digest_a)
+            self.assertEqual(len(list((root / ".pdf_store").rglob("*.pdf"))), 1)
+            for path in (a, b, mirror):
+                self.assertTrue(path.samefile(blob))
+                self.assertEqual(path.read_bytes(), b"%PDF-1.7\nsame")
+
+    def test_pdf_store_concurrent_ingest_of_identical_bytes(self) -> None:
+        data = b"%PDF-1.7\n" + b"x" * (2 * 1024 * 1024)
+        for trial in range(5):
+            with TemporaryDirectory() as tmpdir:
+                root = Path(tmpdir)
+                store = download_papers.PdfStore(root / ".pdf_store")
+                paths = [root / "2025" / "deepseek" / f"{trial}-{i}.pdf" for i in range(4)]
+                for path in paths:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    path.write_bytes(data)
+                barrier = threading.Barrier(len(paths))
+
+                def ingest(path: Path) -> str:
+                    barrier.wait()
+                    return store.ingest(path, root / "pdf" / path.name)
+
+                with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+                    digests = set(pool.map(ingest, paths))
+                self.assertEqual(len(digests), 1)
+                blob = store.blob_path(digests.pop())
+                self.assertEqual(sorted(p.name for p in blob.parent.iterdir()), [blob.name])
+                for path in paths:
+                    self.assertTrue(path.samefile(blob))
+                    self.assertEqual(path.read_bytes(), data)
+
+    def test_get_browser_pool_creates_one_pool_under_concurrent_probes(self) -> None:
+        created = []
+
+        class SlowPool:
+            def __init__(self, max_contexts: int = 1) -> None:
+                time.sleep(0.05)
+                created.append(self)
+
+            def close(self) -> None:
+                return None
+
+        download_papers.shutdown_browser_pool()
+        with patch.object(download_papers, "BrowserPool", SlowPool):
+            try:
+                with ThreadPoolExecutor(max_workers=8) as pool:
+                    pools = list(pool.map(lambda _: download_papers.get_browser_pool(), range(8)))
+            finally:
+                download_papers.shutdown_browser_pool()
+        self.assertEqual(len(created), 1)
+        self.assertTrue(all(p is created[0] for p in pools))
+
+    def test_render_webpage_to_pdf_keeps_existing_file_unless_render_succeeds(self) -> None:
+        class FakePool:
+            def __init__(self, ok: bool) -> None:
+                self.ok = ok
+
+            def render(self, url, output):
+                output.write_bytes(b"%PDF-1.7\nnew\n%%EOF\n")
+                return self.ok
+
+        with TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "2026-02_qwen3.5.pdf"
+            blob = Path(tmpdir) / "blob.pdf"
+            blob.write_bytes(b"%PDF-1.7\nold\n%%EOF\n")
+            os.link(blob, output)
+            with patch.object(download_papers, "can_render_webpage_to_pdf", return_value=False):
+                self.assertFalse(download_papers.render_webpage_to_pdf("https://qwen.ai/blog", output))
+            with patch.object(
+                download_papers, "can_render_webpage_to_pdf", return_value=True
+            ), patch.object(download_papers, "get_browser_pool", return_value=FakePool(False)):
+                self.assertFalse(download_papers.render_webpage_to_pdf("https://qwen.ai/blog", output))
+            self.assertEqual(output.read_bytes(), b"%PDF-1.7\nold\n%%EOF\n")
+            with patch.object(
+                download_papers, "can_render_webpage_to_pdf", return_value=True
+            ), patch.object(download_papers, "get_browser_pool", return_value=FakePool(True)):
+                self.assertTrue(download_papers.render_webpage_to_pdf("https://qwen.ai/blog", output))
+            self.assertEqual(output.read_bytes(), b"%PDF-1.7\nnew\n%%EOF\n")
+            # The store blob behind the old hardlink is untouched.
+            self.assertEqual(blob.read_bytes(), b"%PDF-1.7\nold\n%%EOF\n")
+            self.assertEqual(
+                sorted(p.name for p in Path(tmpdir).iterdir()), ["2026-02_qwen3.5.pdf", "blob.pdf"]
+            )
+
+    def test_browser_pool_reuses_one_browser_and_bounds_contexts(self) -> None:
+        events = []
+        active = {"n": 0, "peak": 0}
+
+        class FakeContext:
+            async def new_page(self):
+                return object()
+
+            async def close(self) -> None:
+                events.append("context_closed")
+
+        class FakeBrowser:
+            async def new_context(self, **kwargs):
+                return FakeContext()
+
+            async def close(self) -> None:
+                events.append("browser_closed")
+
+        async def fake_ensure(pool):
+            if pool._browser is None:
+                events.append("launch")
+                pool._browser = FakeBrowser()
+            return pool._browser
+
+        async def fake_render_page(page, url, output):
+            active["n"] += 1
+            active["peak"] = max(active["peak"], active["n"])
+            await asyncio.sleep(0.02)
+            active["n"] -= 1
+            return True
+
+        with TemporaryDirectory() as tmpdir, patch.object(
+            download_papers.BrowserPool, "_ensure_browser", fake_ensure
+        ), patch.object(download_papers, "_render_page", fake_render_page):
+            pool = download_papers.BrowserPool(max_contexts=2)
+            self.assertTrue(pool.available())
+            outputs = [Path(tmpdir) / f"{i}.pdf" for i in range(5)]
+            with ThreadPoolExecutor(max_workers=5) as workers:
+                rendered = list(workers.map(lambda o: pool.render("https://qwen.ai/blog", o), outputs))
+            pool.close()
+        self.assertEqual(rendered, [True] * 5)
+        self.assertEqual(events.count("launch"), 1)
+        self.assertEqual(events.count("context_closed"), 5)
+        self.assertEqual(events[-1], "browser_closed")
+        self.assertEqual(active["peak"], 2)
+
+    def test_scroll_until_stable_returns_once_page_stops_growing(self) -> None:
+        class FakePage:
+            def __init__(self) -> None:
+                self.heights = [1000, 1800, 2600, 2600, 2600]
+                self.scrolls = 0
+                self.sleeps = 0
+
+            async def evaluate(self, script, *args):
+                if script == download_papers._PAGE_HEIGHT_JS:
+                    return self.heights.pop(0) if len(self.heights) > 1 else self.heights[0]
+                if script == download_papers._DOM_QUIET_JS:
+                    return True
+                if script.startswith("window.scrollTo"):
+                    self.scrolls += 1
+                return None
+
+            async def wait_for_load_state(self, state, timeout):
+                return None
+
+            async def wait_for_timeout(self, ms):
+                self.sleeps += 1
+
+        page = FakePage()
+        started = time.monotonic()
+        asyncio.run(download_papers._scroll_until_stable(page))
+        self.assertLess(time.monotonic() - started, 1.0)
+        # Two grows, then two consecutive rounds without growth.
+        self.assertEqual(page.scrolls, 4)
+        self.assertEqual(page.sleeps, 0)
+
+    def test_scroll_waits_for_lazy_request_that_grows_page_later(self) -> None:
+        class LazyPage:
+            """Second scroll starts a 600 ms XHR; the page only grows when it finishes."""
+
+            def __init__(self) -> None:
+                self.handlers = {}
+                self.height = 1000
+                self.scrolls = 0
+
+            def on(self, event, handler) -> None:
+                self.handlers[event] = handler
+
+            def _finish(self, request) -> None:
+                self.height += 1500
+                self.handlers["requestfinished"](request)
+
+            async def evaluate(self, script, *args):
+                if script == download_papers._PAGE_HEIGHT_JS:
+                    return self.height
+                if script == download_papers._DOM_QUIET_JS:
+                    return True
+                if script.startswith("window.scrollTo"):
+                    self.scrolls += 1
+                    if self.scrolls == 2:
+                        request = object()
+                        self.handlers["request"](request)
+                        asyncio.get_running_loop().call_later(0.6, self._finish, request)
+                return None
+
+        async def run(page):
+            network = download_papers._InflightRequests(page)
+            await download_papers._scroll_until_stable(page, network=network)
+
+        page = LazyPage()
+        asyncio.run(run(page))
+        self.assertEqual(page.height, 2500)
+        # Round 1 stable, round 2 waits for the XHR and grows, then two stable rounds.
+        self.assertEqual(page.scrolls, 4)
+
+    def test_incremental_pipeline_reuses_unchanged_artifact(self) -> None:
+        record = {
+            "release_date": "2025-05",
+            "org": "Alibaba",
+            "org_slug": "alibaba_qwen",
+            "model": "Qwen3",
+            "core_feature": "x",
+            "official_link": "https://arxiv.org/abs/2505.09388",
+        }
+        link = "https://arxiv.org/pdf/2505.09388"
+        with TemporaryDirectory() as tmpdir, patch.object(download_papers, "ROOT", Path(tmpdir)):
+            output = Path(tmpdir) / "2025" / "alibaba_qwen" / "2025-05_qwen3.pdf"
+            output.parent.mkdir(parents=True)
+            output.write_bytes(b"%PDF-1.7\nbody")
+            manifest = download_papers.DownloadManifest(Path(tmpdir) / "manifest.json")
+            download_papers._record_artifact(manifest, link, output)
+
+            def no_network(url, kwargs):
+                raise AssertionError("unexpected request")
+
+            ctx = download_papers.RecordContext(
+                FakeSession(no_network), 1, {}, {}, manifest=manifest, incremental=True
+            )
+            job = download_papers.RecordJob(1, record, link, "probe_ok")
+            done = []
+            with patch.object(
+                download_papers,
+                "infer_release_month_from_source",
+                return_value=(None, "manual_fallback"),
+            ):
+                download_papers.StagePipeline(
+                    ctx, {"resolve": 1, "fetch": 1, "validate": 1, "render": 1}
+                ).run([job], done.append)
+            self.assertEqual(done, [job])
+            self.assertEqual(job.outcome, "ok")
+            self.assertEqual(job.record["local_file_path"], "2025/alibaba_qwen/2025-05_qwen3.pdf")
+
+            output.write_bytes(b"%PDF-1.7\nbodz")
+            self.assertFalse(
+                download_papers.is_local_artifact_current(manifest.get(link), output)
+            )
+
+    def test_build_session_retries_on_503_and_counts_retries(self) -> None:
+        FlakyHandler.hits = 0
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            session = download_papers.build_session(retries=2, backoff_factor=0, read_timeout=5)
+            url = f"http://127.0.0.1:{server.server_address[1]}/report.pdf"
+            resp = session.get(url, timeout=download_papers.request_timeout(session))
+            self.assertEqual(resp.status_code, 200)
+            self.assertEqual(download_papers.retry_count(session, url), 1)
+            self.assertEqual(download_papers.request_timeout(session), (10.0, 5))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    @unittest.skipIf(download_papers.httpx is None, "httpx is not installed")
+    def test_async_session_retries_on_503_and_counts_retries(self) -> None:
+        FlakyHandler.hits = 0
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        session = download_papers.build_async_session(retries=2, backoff_factor=0, read_timeout=5)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/report.pdf"
+            with session.get(url, timeout=download_papers.request_timeout(session), stream=True) as resp:
+                self.assertEqual(resp.status_code, 200)
+                self.assertEqual(b"".join(resp.iter_content(1)), b"ok")
+            self.assertEqual(download_papers.retry_count(session, url), 1)
+            self.assertEqual(FlakyHandler.hits, 2)
+        finally:
+            session.close()
+            server.shutdown()
+            server.server_close()
+
+    def test_capped_retry_bounds_retry_after(self) -> None:
+        retry = download_papers.CappedRetry(total=1, max_retry_after=5).new(total=0)
+
+        class Resp:
+            headers = {"Retry-After": "3600"}
+
+            def getheader(self, name, default=None):
+                return self.headers.get(name, default)
+
+        self.assertEqual(retry.max_retry_after, 5)
+        self.assertEqual(retry.get_retry_after(Resp()), 5)
+
+    def test_prefetch_release_months_batches_arxiv_ids_in_one_request(self) -> None:
+        feed = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <id>http://arxiv.org/abs/2505.09388v1</id>
+    <published>2025-05-14T17:00:00Z</published>
+  </entry>
+  <entry>
+    <id>http://arxiv.org/abs/2602.15763v2</id>
+    <published>2026-02-17T10:00:00Z</published>
+  </entry>
+</feed>"""
+        session = FakeSession(lambda url, kwargs: FakeResponse(200, feed))
+        links = [
+            "https://arxiv.org/pdf/2505.09388",
+            "https://arxiv.org/pdf/2602.15763",
+            "https://arxiv.org/pdf/2412.19437",
+            "https://arxiv.org/pdf/2501.00001",
+            "https://qwen.ai/blog?id=qwen3.5",
+        ]
+        frequency = {"https://arxiv.org/pdf/2412.19437": 2}
+        cache = {}
+        download_papers.prefetch_release_months(session, links, frequency, cache)
+        self.assertEqual(len(session.calls), 1)
+        self.assertEqual(
+            session.calls[0][1]["params"],
+            {"id_list": "2505.09388,2602.15763,2412.19437,2501.00001", "max_results": 4},
+        )
+        self.assertEqual(
+            cache,
+            {
+                "https://arxiv.org/pdf/2505.09388": ("2025-05", "arxiv_published"),
+                "https://arxiv.org/pdf/2602.15763": ("2026-02", "arxiv_published"),
+            },
+        )
+
+    def test_parse_arxiv_feed_collects_entry_metadata(self) -> None:
+        feed = io.BytesIO(
+            b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <id>http://arxiv.org/abs/2602.15763v3</id>
+    <updated>2026-03-02T09:00:00Z</updated>
+    <published>2026-02-17T10:00:00Z</published>
+    <title>GLM-5:
+      from Vibe Coding to Agentic Engineering</title>
+    <summary>  We present GLM-5.
+    </summary>
+    <author><name>Alice A</name></author>
+    <author><name>Bob B</name></author>
+  </entry>
+</feed>"""
+        )
+        self.assertEqual(
+            download_papers.parse_arxiv_feed(feed),
+            {
+                "2602.15763": {
+                    "arxiv_id": "2602.15763",
+                    "version": 3,
+                    "title": "GLM-5: from Vibe Coding to Agentic Engineering",
+                    "authors": ["Alice A", "Bob B"],
+                    "abstract": "We present GLM-5.",
+                    "published": "2026-02-17",
+                    "updated": "2026-03-02",
+                }
+            },
+        )
+
+    def test_new_arxiv_version_forces_redownload_in_incremental_mode(self) -> None:
+        link = "https://arxiv.org/pdf/2602.15763"
+        models = [
+            {
+                "release_date": "2026-02",
+                "org": "Zhipu AI",
+                "org_slug": "zhipu",
+                "model": "GLM-5",
+                "core_feature": "x",
+                "official_link": link,
+            }
+        ]
+        body = b"%PDF-1.7\nv1\n%%EOF\n"
+        meta = {"arxiv_id": "2602.15763", "version": 2, "published": "2026-02-17"}
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            output = root / "2026" / "zhipu" / "2026-02_glm-5.pdf"
+            output.parent.mkdir(parents=True)
+            output.write_bytes(body)
+            manifest = download_papers.DownloadManifest(root / "manifest.json")
+            manifest.update(
+                link,
+                etag='"v1"',
+                content_length=len(body),
+                sha256=download_papers.file_sha256(output),
+                arxiv_version=1,
+            )
+            fetched = []
+
+            def fake_fetch(session, url, out, manifest=None):
+                fetched.append(url)
+                out.write_bytes(b"%PDF-1.7\nv2\n%%EOF\n")
+                return "ok", "application/pdf"
+
+            with patch.object(download_papers, "ROOT", root), patch.object(
+                download_papers, "_fetch_pdf", side_effect=fake_fetch
+            ):
+                ctx = download_papers.RecordContext(
+                    None,
+                    1,
+                    {link: 1},
+                    {link: ("2026-02", "arxiv_published")},
+                    manifest=manifest,
+                    incremental=True,
+                    arxiv_metadata={"2602.15763": meta},
+                )
+                job = download_papers.RecordJob(1, models[0], link, "declared")
+                download_papers.StagePipeline(
+                    ctx, {"resolve": 1, "fetch": 1, "validate": 1, "render": 1}
+                ).run([job], lambda done: None)
+        record = job.record
+        self.assertEqual(job.outcome, "ok")
+        self.assertEqual(fetched, [link])
+        self.assertEqual(record["arxiv"]["version"], 2)
+        self.assertIsNone(manifest.get(link)["etag"])
+        self.assertEqual(manifest.get(link)["arxiv_version"], 2)
+
+    def test_web_date_scanner_prefers_structured_metadata(self) -> None:
+        scanner = download_papers.WebDateScanner()
+        self.assertFalse(scanner.feed("<p>Posted 2025/11/03 · news</p><p>Released on 2025-09-01</p>"))
+        self.assertEqual(scanner.result(), "2025-11")
+        # A meta tag split across chunks still wins over body dates seen earlier.
+        self.assertFalse(scanner.feed('<meta property="article:published_time" content="2025-10-'))
+        self.assertTrue(scanner.feed('07T08:00:00Z">'))
+        self.assertEqual(scanner.result(), "2025-10")
+
+    def test_web_date_scanner_keeps_rule_precedence(self) -> None:
+        cases = [
+            # The inline "date ·" rule beats the keyword rule even when a keyword
+            # match would swallow the first inline date.
+            ("<p>Published 2025-01-02 · Blog</p><p>Changelog 2025-03-04 · fixes</p>", "2025-01"),
+            # article:published_time beats an earlier JSON-LD datePublished.
+            (
+                '<script>{"datePublished": "2025-04-01"}</script>'
+                '<meta property="article:published_time" content="2025-05-02"></head>',
+                "2025-05",
+            ),
+        ]
+        for page, expected in cases:
+            scanner = download_papers.WebDateScanner()
+            for i in range(0, len(page), 7):
+                scanner.feed(page[i : i + 7])
+            self.assertEqual(scanner.result(), expected, page)
+
+    def test_fetch_webpage_published_month_stops_reading_after_head_metadata(self) -> None:
+        download_papers.configure_html_head_budget()
+        head = b'<html><head><script type="application/ld+json">{"datePublished": "2026-02-16"}</script></head>'
+        resp = FakeResponse(
+            200,
+            head + b"<body>" + b"x" * 200000 + b"2025-01-01 |</body>",
+            {"Content-Type": "text/html; charset=utf-8"},
+        )
+        session = FakeSession(lambda url, kwargs: resp)
+        month = download_papers.fetch_webpage_published_month(session, "https://qwen.ai/blog?id=qwen3.5")
+        self.assertEqual(month, "2026-02")
+        self.assertTrue(session.calls[0][1]["stream"])
+        self.assertEqual(resp.chunks_read, 1)
+
+    def test_html_probe_and_date_inference_share_one_head_read(self) -> None:
+        download_papers.configure_html_head_budget()
+        url = "https://qwen.ai/blog?id=qwen3.5"
+        page = (
+            b'<html><head><meta property="article:published_time" content="2026-02-16">'
+            b"</head><body>Posted 2026/01/30 \xc2\xb7 Qwen"
+        )
+        resp = FakeResponse(200, page + b"x" * 100000, {"Content-Type": "text/html"})
+        session = FakeSession(lambda url, kwargs: resp)
+        with patch.object(download_papers, "can_render_webpage_to_pdf", return_value=True):
+            self.assertEqual(
+                download_papers.probe_source_url(session, url), (True, "html_renderable")
+            )
+        self.assertEqual(download_papers.fetch_webpage_published_month(session, url), "2026-02")
+        self.assertEqual(len(session.calls), 1)
+        self.assertEqual(resp.chunks_read, 1)
+        self.assertEqual(download_papers.get_html_head(session, url).bytes_read, 16384)
+
     def test_load_models_from_json_accepts_runtime_snapshot(self) -> None:
         with TemporaryDirectory() as tmpdir:
             models_path = Path(tmpdir) / "models.json"
@@ -133,6 +1078,203 @@ class DownloadPapersTests(unittest.TestCase):
             self.assertEqual(len(models), 1)
             self.assertEqual(models[0]["model"], "GPT-X")
 
+    def _run_main(self, models, jobs: int, downloads=None) -> list:
+        def fake_download(session, url, output, manifest=None, check=None):
+            if downloads is not None:
+                downloads.append(url)
+            data = b"%PDF-1.7\n" + url.encode("utf-8") + b"\n%%EOF\n"
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_bytes(data)
+            if check is not None:
+                check.feed(data)
+            return True, "application/pdf"
+
+        with TemporaryDirectory() as tmpdir:
+            results_path = Path(tmpdir) / "results.json"
+            with patch.object(download_papers, "ROOT", Path(tmpdir)), patch.object(
+                download_papers, "probe_source_url", return_value=(True, "pdf_content_type")
+            ), patch.object(
+                download_papers,
+                "infer_release_month_from_source",
+                return_value=(None, "manual_fallback"),
+            ), patch.object(
+                download_papers, "download_file", side_effect=fake_download
+            ), patch.object(
+                download_papers, "extract_text_length_from_pdf", return_value=1000
+            ), patch("builtins.print"):
+                download_papers.main(models=models, results_json=results_path, jobs=jobs)
+            return json.loads(results_path.read_text(encoding="utf-8"))
+
+    def _run_main_against_archive(self, backend: str) -> list:
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), ArchiveHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        models = [
+            {
+                "release_date": f"2025-0{i}",
+                "org": "Org",
+                "org_slug": "org",
+                "model": f"Model {i}",
+                "core_feature": "x",
+                "official_link": f"{base}/2025-0{i}/{'report' if i != 2 else 'gone'}.pdf",
+            }
+            for i in range(1, 5)
+        ]
+        try:
+            with TemporaryDirectory() as tmpdir:
+                results_path = Path(tmpdir) / "results.json"
+                with patch.object(download_papers, "ROOT", Path(tmpdir)), patch("builtins.print"):
+                    download_papers.main(
+                        models=models, results_json=results_path, jobs=3, backend=backend
+                    )
+                self.assertEqual(
+                    (Path(tmpdir) / "2025/org/2025-04_model-4.pdf").read_bytes(), ArchiveHandler.pdf
+                )
+                return json.loads(results_path.read_text(encoding="utf-8").replace(base, "BASE"))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_main_pipeline_against_local_server(self) -> None:
+        results = self._run_main_against_archive("threads")
+        self.assertEqual(
+            [r["local_file_path"] for r in results],
+            [
+                "2025/org/2025-04_model-4.pdf",
+                "2025/org/2025-03_model-3.pdf",
+                "下载失败",
+                "2025/org/2025-01_model-1.pdf",
+            ],
+        )
+
+    @unittest.skipIf(download_papers.httpx is None, "httpx is not installed")
+    def test_async_backend_writes_the_same_results_json(self) -> None:
+        self.assertEqual(
+            self._run_main_against_archive("async"), self._run_main_against_archive("threads")
+        )
+
+    def test_stage_pipeline_downloads_pdfs_while_a_render_is_blocked(self) -> None:
+        items = [
+            {
+                "release_date": "2026-02",
+                "org": "Qwen",
+                "org_slug": "alibaba_qwen",
+                "model": "Qwen3.5",
+                "core_feature": "x",
+                "official_link": "https://qwen.ai/blog?id=qwen3.5",
+            },
+            {
+                "release_date": "2026-01",
+                "org": "Org",
+                "org_slug": "org",
+                "model": "Model A",
+                "core_feature": "x",
+                "official_link": "https://example.com/a.pdf",
+            },
+        ]
+
+        pdf_done = threading.Event()
+
+        def fake_download(session, url, output, manifest=None, check=None):
+            data = b"%PDF-1.7\nbody\n%%EOF\n"
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_bytes(data)
+            check.feed(data)
+            pdf_done.set()
+            return True, "application/pdf"
+
+        def blocked_render(link, output, manifest):
+            # Only finishes once the later PDF record has been fetched.
+            return pdf_done.wait(timeout=5)
+
+        with TemporaryDirectory() as tmpdir, patch.object(
+            download_papers, "ROOT", Path(tmpdir)
+        ), patch.object(
+            download_papers,
+            "infer_release_month_from_source",
+            return_value=(None, "manual_fallback"),
+        ), patch.object(
+            download_papers, "download_file", side_effect=fake_download
+        ), patch.object(
+            download_papers, "_render_once", side_effect=blocked_render
+        ), patch.object(
+            download_papers, "extract_text_length_from_pdf", return_value=7
+        ):
+            ctx = download_papers.RecordContext(None, len(items), {}, {})
+            jobs = [
+                download_papers.RecordJob(i, item, item["official_link"], "declared")
+                for i, item in enumerate(items, start=1)
+            ]
+            done = []
+            download_papers.StagePipeline(
+                ctx, {"resolve": 1, "fetch": 1, "validate": 1, "render": 1}
+            ).run(jobs, done.append)
+        self.assertEqual([job.idx for job in done], [1, 2])
+        self.assertEqual([job.outcome for job in done], ["ok", "ok"])
+        self.assertIn("可提取文本=7", done[1].log[-1])
+
+    def test_main_parallel_jobs_keep_sorted_result_order(self) -> None:
+        models = [
+            {
+                "release_date": f"2025-{month:02d}",
+                "org": "Org",
+                "org_slug": "org",
+                "model": f"Model {month}",
+                "core_feature": "x",
+                "official_link": f"https://example{month % 2}.com/m{month}.pdf",
+            }
+            for month in range(1, 9)
+        ]
+        serial = self._run_main(models, jobs=1)
+        parallel = self._run_main(models, jobs=4)
+        self.assertEqual(serial, parallel)
+        self.assertEqual([r["model"] for r in parallel][0], "Model 8")
+        self.assertTrue(all(r["local_file_path"].endswith(".pdf") for r in parallel))
+
+    def test_main_fetches_shared_link_once_for_all_records(self) -> None:
+        models = [
+            {
+                "release_date": release_date,
+                "org": "DeepSeek",
+                "org_slug": "deepseek",
+                "model": model,
+                "core_feature": "x",
+                "official_link": "https://arxiv.org/abs/2412.19437",
+            }
+            for release_date, model in [("2025-01", "DeepSeek V3"), ("2025-09", "DeepSeek V3.1-Terminus")]
+        ]
+        for jobs in (1, 2):
+            downloads = []
+            results = self._run_main(models, jobs=jobs, downloads=downloads)
+            self.assertEqual(downloads, ["https://arxiv.org/pdf/2412.19437"])
+            self.assertEqual(
+                [r["local_file_path"] for r in results],
+                [
+                    "2025/deepseek/2025-09_deepseek-v3.1-terminus.pdf",
+                    "2025/deepseek/2025-01_deepseek-v3.pdf",
+                ],
+            )
+
+    def test_host_limiter_caps_concurrency_per_host(self) -> None:
+        limiter = download_papers.HostLimiter(per_host=2)
+        active = {"n": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def work() -> None:
+            with limiter.slot("https://arxiv.org/pdf/1"):
+                with lock:
+                    active["n"] += 1
+                    active["peak"] = max(active["peak"], active["n"])
+                time.sleep(0.02)
+                with lock:
+                    active["n"] -= 1
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            for _ in range(6):
+                pool.submit(work)
+        self.assertLessEqual(active["peak"], 2)
+
 
 if __name__ == "__main__":
     unittest.main()
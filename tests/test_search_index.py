@@ -0,0 +1,77 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import download_papers
+from scripts import search_index
+from tests.test_download_papers import build_text_pdf
+
+
+def _row(release_date: str, organization: str, model: str, local_file: str) -> dict:
+    return {
+        "release_date": release_date,
+        "organization": organization,
+        "model": model,
+        "core_highlights": "",
+        "official_link": "",
+        "local_file": local_file,
+    }
+
+
+class SearchIndexTests(unittest.TestCase):
+    def test_build_index_is_incremental_and_query_filters(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            files = {
+                "2025/deepseek/2025-01_deepseek-v3.pdf": ["sparse mixture of experts routing"],
+                "2026/zhipu/2026-02_glm-5.pdf": ["agentic engineering with mixture of experts"],
+            }
+            for rel, pages in files.items():
+                (root / rel).parent.mkdir(parents=True, exist_ok=True)
+                (root / rel).write_bytes(build_text_pdf(pages))
+            rows = [
+                _row("2026-02", "Zhipu AI", "GLM-5", "2026/zhipu/2026-02_glm-5.pdf"),
+                _row("2025-01", "DeepSeek", "DeepSeek V3", "2025/deepseek/2025-01_deepseek-v3.pdf"),
+                _row("2025-12", "Alibaba", "Qwen 3.5", "Online only"),
+            ]
+            conn = search_index.connect(root / "index.sqlite3")
+            extractor = download_papers.TextExtractor()
+
+            stats = search_index.build_index(conn, rows, root, extractor)
+            self.assertEqual(stats, {"indexed": 2, "unchanged": 0, "removed": 0})
+            self.assertEqual(len(search_index.search(conn, "mixture")), 2)
+            hits = search_index.search(conn, "mixture", org="zhipu")
+            self.assertEqual([h["model"] for h in hits], ["GLM-5"])
+            hits = search_index.search(conn, "experts", date_to="2025-12")
+            self.assertEqual([h["model"] for h in hits], ["DeepSeek V3"])
+
+            (root / "2026/zhipu/2026-02_glm-5.pdf").write_bytes(build_text_pdf(["linear attention"]))
+            stats = search_index.build_index(conn, rows[:2], root, extractor)
+            self.assertEqual(stats, {"indexed": 1, "unchanged": 1, "removed": 0})
+            self.assertEqual([h["model"] for h in search_index.search(conn, "linear")], ["GLM-5"])
+            self.assertEqual(len(search_index.search(conn, "agentic")), 0)
+
+            stats = search_index.build_index(conn, rows[1:2], root, extractor)
+            self.assertEqual(stats["removed"], 1)
+            conn.close()
+
+    def test_plain_queries_with_punctuation_match_literally(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            rel = "2025/openai/2025-08_gpt-5.pdf"
+            (root / rel).parent.mkdir(parents=True, exist_ok=True)
+            (root / rel).write_bytes(build_text_pdf(["GPT-5 system card and Qwen3.5 comparison"]))
+            conn = search_index.connect(root / "index.sqlite3")
+            search_index.build_index(
+                conn, [_row("2025-08", "OpenAI", "GPT-5", rel)], root, download_papers.TextExtractor()
+            )
+            for query in ("GPT-5", "Qwen3.5", 'system "card'):
+                self.assertEqual([h["model"] for h in search_index.search(conn, query)], ["GPT-5"])
+            self.assertEqual(len(search_index.search(conn, "system OR nothing", raw=True)), 1)
+            with self.assertRaises(search_index.sqlite3.OperationalError):
+                search_index.search(conn, "GPT-5", raw=True)
+            conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import json
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from scripts import verify_archive
+from tests.test_download_papers import build_text_pdf
+
+
+class VerifyArchiveTests(unittest.TestCase):
+    def test_verify_archive_flags_broken_and_mismatched_files(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            good = build_text_pdf(["technical report " * 30])
+            (root / "2025" / "org").mkdir(parents=True)
+            (root / "2026" / "org").mkdir(parents=True)
+            (root / "pdf").mkdir()
+            (root / "2025" / "org" / "2025-01_a.pdf").write_bytes(good)
+            (root / "pdf" / "2025-01_a.pdf").write_bytes(build_text_pdf(["other " * 60]))
+            (root / "2026" / "org" / "2026-02_b.pdf").write_bytes(b"<html>login</html>")
+            manifest = root / "manifest.json"
+            entry = {"path": "2025/org/2025-01_a.pdf", "sha256": "0" * 64}
+            manifest.write_text(json.dumps({"https://x/a.pdf": entry}), encoding="utf-8")
+
+            report = verify_archive.verify_archive(root, manifest_path=manifest, workers=1)
+
+        issues = {f["path"]: f["issues"] for f in report["files"]}
+        self.assertEqual(issues["2025/org/2025-01_a.pdf"], ["manifest_hash_mismatch"])
+        self.assertEqual(issues["pdf/2025-01_a.pdf"], ["mirror_hash_mismatch"])
+        self.assertEqual(issues["2026/org/2026-02_b.pdf"], ["bad_signature", "missing_eof_trailer"])
+        self.assertEqual(report["summary"]["problems"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()